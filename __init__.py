@@ -1,88 +1,190 @@
-"""Public interface for shared x_make_common_x utilities."""
+"""Public interface for shared x_make_common_x utilities.
+
+Re-exports resolve lazily via PEP 562 module ``__getattr__`` so that
+importing the package does not load every submodule; callers pay the
+import cost only for the names they actually touch.
+"""
 
 from __future__ import annotations
 
-from x_make_common_x.copilot_normalizer import (
-    DEFAULT_PERSONA_PROMPT,
-    PersonaPromptError,
-    extract_answer_text,
-    extract_highlights,
-    extract_tags,
-    format_persona_question,
-    score_from_answer,
-    source_from_response,
-    synopsis_from_answer,
-)
-from x_make_common_x.detect import (
-    DEFAULT_EXCLUDE_DIRS as DETECT_DEFAULT_EXCLUDE_DIRS,
-)
-from x_make_common_x.detect import (
-    DEFAULT_NAME_PATTERNS as DETECT_DEFAULT_NAME_PATTERNS,
-)
-from x_make_common_x.detect import (
-    EntryPointCandidate,
-    EntryPointDiscovery,
-    scan_python_entrypoints,
-)
-from x_make_common_x.exporters import (  # re-export shared exporters
-    CommandRunner,
-    ExportResult,
-    export_graphviz_to_svg,
-    export_markdown_to_pdf,
-    export_mermaid_to_svg,
-)
-from x_make_common_x.json_board import (
-    BoardState as JsonBoardState,
-)
-from x_make_common_x.json_board import (
-    CardRecord as JsonCardRecord,
-)
-from x_make_common_x.json_board import (
-    board_from_records,
-    dump_board,
-)
-from x_make_common_x.json_board import (
-    load_board as load_json_board,
-)
-from x_make_common_x.json_board import (
-    save_board as save_json_board,
-)
-from x_make_common_x.json_contracts import validate_payload, validate_schema
-from x_make_common_x.ledger import LedgerEvent, LedgerWriter
-from x_make_common_x.ledger import append_event as ledger_append_event
-from x_make_common_x.persona_vetting import (
-    PersonaEvidence,
-    PersonaVettingError,
-    PersonaVettingService,
-)
-from x_make_common_x.progress_snapshot import (
-    ProgressSnapshot,
-    ProgressStage,
-    ProgressStatus,
-    create_progress_snapshot,
-    load_progress_snapshot,
-    write_progress_snapshot,
-)
-from x_make_common_x.run_reports import (
-    REPORTS_DIR_NAME,
-    TIMESTAMP_FILENAME_FORMAT,
-    ensure_reports_dir,
-    isoformat_timestamp,
-    write_run_report,
-)
-from x_make_common_x.stage_progress import (
-    RepoProgressReporter,
-    StageProgressEntry,
-    StageProgressWriter,
-)
-from x_make_common_x.x_env_x import (
-    ensure_workspace_on_syspath,
-    get_env_bool,
-    get_env_str,
-)
-from x_make_common_x.x_http_client_x import HttpClient, HttpError, HttpResponse
-from x_make_common_x.x_logging_utils_x import get_logger, log_debug, log_error, log_info
-from x_make_common_x.x_subprocess_utils_x import CommandError, run_command
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from x_make_common_x.copilot_normalizer import (
+        DEFAULT_PERSONA_PROMPT,
+        PersonaPromptError,
+        extract_answer_text,
+        extract_highlights,
+        extract_tags,
+        format_persona_question,
+        score_from_answer,
+        source_from_response,
+        synopsis_from_answer,
+    )
+    from x_make_common_x.detect import (
+        DEFAULT_EXCLUDE_DIRS as DETECT_DEFAULT_EXCLUDE_DIRS,
+    )
+    from x_make_common_x.detect import (
+        DEFAULT_NAME_PATTERNS as DETECT_DEFAULT_NAME_PATTERNS,
+    )
+    from x_make_common_x.detect import (
+        EntryPointCandidate,
+        EntryPointDiscovery,
+        scan_python_entrypoints,
+    )
+    from x_make_common_x.exporters import (
+        CommandRunner,
+        ExportResult,
+        export_graphviz_to_svg,
+        export_markdown_to_pdf,
+        export_mermaid_to_svg,
+    )
+    from x_make_common_x.json_board import (
+        BoardState as JsonBoardState,
+    )
+    from x_make_common_x.json_board import (
+        CardRecord as JsonCardRecord,
+    )
+    from x_make_common_x.json_board import (
+        board_from_records,
+        dump_board,
+    )
+    from x_make_common_x.json_board import (
+        load_board as load_json_board,
+    )
+    from x_make_common_x.json_board import (
+        save_board as save_json_board,
+    )
+    from x_make_common_x.json_contracts import validate_payload, validate_schema
+    from x_make_common_x.ledger import LedgerEvent, LedgerWriter
+    from x_make_common_x.ledger import append_event as ledger_append_event
+    from x_make_common_x.persona_vetting import (
+        PersonaEvidence,
+        PersonaVettingError,
+        PersonaVettingService,
+    )
+    from x_make_common_x.progress_snapshot import (
+        ProgressSnapshot,
+        ProgressStage,
+        ProgressStatus,
+        create_progress_snapshot,
+        load_progress_snapshot,
+        write_progress_snapshot,
+    )
+    from x_make_common_x.run_reports import (
+        REPORTS_DIR_NAME,
+        TIMESTAMP_FILENAME_FORMAT,
+        ensure_reports_dir,
+        isoformat_timestamp,
+        write_run_report,
+    )
+    from x_make_common_x.stage_progress import (
+        RepoProgressReporter,
+        StageProgressEntry,
+        StageProgressWriter,
+    )
+    from x_make_common_x.telemetry import (
+        TelemetryEvent,
+        emit_event,
+        make_event,
+    )
+    from x_make_common_x.x_env_x import (
+        ensure_workspace_on_syspath,
+        get_env_bool,
+        get_env_str,
+    )
+    from x_make_common_x.x_http_client_x import HttpClient, HttpError, HttpResponse
+    from x_make_common_x.x_logging_utils_x import (
+        get_logger,
+        log_debug,
+        log_error,
+        log_info,
+    )
+    from x_make_common_x.x_subprocess_utils_x import CommandError, run_command
+
+# Exported name -> (submodule, attribute on that submodule).
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "DEFAULT_PERSONA_PROMPT": ("copilot_normalizer", "DEFAULT_PERSONA_PROMPT"),
+    "DETECT_DEFAULT_EXCLUDE_DIRS": ("detect", "DEFAULT_EXCLUDE_DIRS"),
+    "DETECT_DEFAULT_NAME_PATTERNS": ("detect", "DEFAULT_NAME_PATTERNS"),
+    "REPORTS_DIR_NAME": ("run_reports", "REPORTS_DIR_NAME"),
+    "TIMESTAMP_FILENAME_FORMAT": ("run_reports", "TIMESTAMP_FILENAME_FORMAT"),
+    "CommandError": ("x_subprocess_utils_x", "CommandError"),
+    "CommandRunner": ("exporters", "CommandRunner"),
+    "EntryPointCandidate": ("detect", "EntryPointCandidate"),
+    "EntryPointDiscovery": ("detect", "EntryPointDiscovery"),
+    "ExportResult": ("exporters", "ExportResult"),
+    "HttpClient": ("x_http_client_x", "HttpClient"),
+    "HttpError": ("x_http_client_x", "HttpError"),
+    "HttpResponse": ("x_http_client_x", "HttpResponse"),
+    "JsonBoardState": ("json_board", "BoardState"),
+    "JsonCardRecord": ("json_board", "CardRecord"),
+    "LedgerEvent": ("ledger", "LedgerEvent"),
+    "LedgerWriter": ("ledger", "LedgerWriter"),
+    "PersonaEvidence": ("persona_vetting", "PersonaEvidence"),
+    "PersonaPromptError": ("copilot_normalizer", "PersonaPromptError"),
+    "PersonaVettingError": ("persona_vetting", "PersonaVettingError"),
+    "PersonaVettingService": ("persona_vetting", "PersonaVettingService"),
+    "ProgressSnapshot": ("progress_snapshot", "ProgressSnapshot"),
+    "ProgressStage": ("progress_snapshot", "ProgressStage"),
+    "ProgressStatus": ("progress_snapshot", "ProgressStatus"),
+    "RepoProgressReporter": ("stage_progress", "RepoProgressReporter"),
+    "StageProgressEntry": ("stage_progress", "StageProgressEntry"),
+    "StageProgressWriter": ("stage_progress", "StageProgressWriter"),
+    "TelemetryEvent": ("telemetry", "TelemetryEvent"),
+    "board_from_records": ("json_board", "board_from_records"),
+    "create_progress_snapshot": ("progress_snapshot", "create_progress_snapshot"),
+    "dump_board": ("json_board", "dump_board"),
+    "emit_event": ("telemetry", "emit_event"),
+    "ensure_reports_dir": ("run_reports", "ensure_reports_dir"),
+    "ensure_workspace_on_syspath": ("x_env_x", "ensure_workspace_on_syspath"),
+    "export_graphviz_to_svg": ("exporters", "export_graphviz_to_svg"),
+    "export_markdown_to_pdf": ("exporters", "export_markdown_to_pdf"),
+    "export_mermaid_to_svg": ("exporters", "export_mermaid_to_svg"),
+    "extract_answer_text": ("copilot_normalizer", "extract_answer_text"),
+    "extract_highlights": ("copilot_normalizer", "extract_highlights"),
+    "extract_tags": ("copilot_normalizer", "extract_tags"),
+    "format_persona_question": ("copilot_normalizer", "format_persona_question"),
+    "get_env_bool": ("x_env_x", "get_env_bool"),
+    "get_env_str": ("x_env_x", "get_env_str"),
+    "get_logger": ("x_logging_utils_x", "get_logger"),
+    "isoformat_timestamp": ("run_reports", "isoformat_timestamp"),
+    "ledger_append_event": ("ledger", "append_event"),
+    "load_json_board": ("json_board", "load_board"),
+    "load_progress_snapshot": ("progress_snapshot", "load_progress_snapshot"),
+    "log_debug": ("x_logging_utils_x", "log_debug"),
+    "log_error": ("x_logging_utils_x", "log_error"),
+    "log_info": ("x_logging_utils_x", "log_info"),
+    "make_event": ("telemetry", "make_event"),
+    "run_command": ("x_subprocess_utils_x", "run_command"),
+    "save_json_board": ("json_board", "save_board"),
+    "scan_python_entrypoints": ("detect", "scan_python_entrypoints"),
+    "score_from_answer": ("copilot_normalizer", "score_from_answer"),
+    "source_from_response": ("copilot_normalizer", "source_from_response"),
+    "synopsis_from_answer": ("copilot_normalizer", "synopsis_from_answer"),
+    "validate_payload": ("json_contracts", "validate_payload"),
+    "validate_schema": ("json_contracts", "validate_schema"),
+    "write_progress_snapshot": ("progress_snapshot", "write_progress_snapshot"),
+    "write_run_report": ("run_reports", "write_run_report"),
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    value: object = getattr(module, attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "DEFAULT_PERSONA_PROMPT",
@@ -112,9 +214,11 @@ __all__ = [
     "RepoProgressReporter",
     "StageProgressEntry",
     "StageProgressWriter",
+    "TelemetryEvent",
     "board_from_records",
     "create_progress_snapshot",
     "dump_board",
+    "emit_event",
     "ensure_reports_dir",
     "ensure_workspace_on_syspath",
     "export_graphviz_to_svg",
@@ -134,6 +238,7 @@ __all__ = [
     "log_debug",
     "log_error",
     "log_info",
+    "make_event",
     "run_command",
     "save_json_board",
     "scan_python_entrypoints",
@@ -0,0 +1,86 @@
+"""Internal JSON codec shim that prefers orjson with a stdlib fallback.
+
+Named ``_json_codec`` rather than ``_json`` so it can never shadow the
+stdlib's private ``_json`` accelerator module when the package directory
+appears on ``sys.path``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from typing import Protocol, cast
+
+
+class _OrjsonModule(Protocol):
+    """Subset of the orjson API we rely on."""
+
+    OPT_INDENT_2: int
+    OPT_SORT_KEYS: int
+
+    def loads(self, data: bytes | str) -> object: ...
+
+    def dumps(self, obj: object, *, option: int = ...) -> bytes: ...
+
+
+def _load_orjson() -> _OrjsonModule | None:
+    """Import orjson when available; the native codec is optional."""
+
+    try:
+        module = importlib.import_module("orjson")
+    except ImportError:
+        return None
+    return cast("_OrjsonModule", module)
+
+
+_ORJSON: _OrjsonModule | None = _load_orjson()
+
+
+def loads(data: str | bytes) -> object:
+    """Parse a JSON document from text or UTF-8 bytes."""
+
+    if _ORJSON is not None:
+        return _ORJSON.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(
+    obj: object,
+    *,
+    indent_2: bool = False,
+    sort_keys: bool = False,
+) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes, avoiding an extra encode step."""
+
+    if _ORJSON is not None:
+        option = 0
+        if indent_2:
+            option |= _ORJSON.OPT_INDENT_2
+        if sort_keys:
+            option |= _ORJSON.OPT_SORT_KEYS
+        return _ORJSON.dumps(obj, option=option)
+    # Compact separators and raw UTF-8 keep the fallback byte-compatible
+    # with orjson, so persisted checksums verify regardless of which
+    # codec produced them.
+    serialized = json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent_2 else None,
+        sort_keys=sort_keys,
+        separators=None if indent_2 else (",", ":"),
+    )
+    return serialized.encode("utf-8")
+
+
+def dumps(
+    obj: object,
+    *,
+    indent_2: bool = False,
+    sort_keys: bool = False,
+) -> str:
+    """Serialize *obj* to a JSON string."""
+
+    return dumps_bytes(obj, indent_2=indent_2, sort_keys=sort_keys).decode("utf-8")
+
+
+__all__ = ["dumps", "dumps_bytes", "loads"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 
 _POSITIVE_TERMS = re.compile(
     r"\b(excellent|strong|trusted|reliable|experienced)\b",
@@ -11,6 +11,8 @@ _POSITIVE_TERMS = re.compile(
 _NEGATIVE_TERMS = re.compile(
     r"\b(risk|concern|fraud|unsafe|unknown)\b",
 )
+_HASHTAG = re.compile(r"#([\w-]{2,32})")
+_SENTENCE_SPLIT = re.compile(r"[.!?]\s+")
 
 DEFAULT_PERSONA_PROMPT = (
     "You are reviewing the persona '{persona_id}'. "
@@ -19,6 +21,18 @@ DEFAULT_PERSONA_PROMPT = (
 )
 
 
+def _uniq(items: Iterable[str]) -> tuple[str, ...]:
+    """Deduplicate *items* preserving first-seen order."""
+
+    seen: set[str] = set()
+    out: list[str] = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+    return tuple(out)
+
+
 class PersonaPromptError(ValueError):
     """Raised when persona prompt templates cannot be rendered."""
 
@@ -64,14 +78,13 @@ def extract_tags(response: Mapping[str, object]) -> tuple[str, ...]:
     tags = response.get("tags")
     if isinstance(tags, Sequence) and not isinstance(tags, (str, bytes)):
         normalized = [str(tag).strip() for tag in tags if str(tag).strip()]
-        # Preserve insertion order while removing duplicates.
-        return tuple(dict.fromkeys(normalized))
+        return _uniq(normalized)
 
     answer = extract_answer_text(response)
     if not answer:
         return ()
-    matches = re.findall(r"#([\w-]{2,32})", answer)
-    return tuple(dict.fromkeys(match.lower() for match in matches))
+    matches = _HASHTAG.findall(answer)
+    return _uniq(match.lower() for match in matches)
 
 
 def extract_highlights(response: Mapping[str, object]) -> tuple[str, ...]:
@@ -93,7 +106,9 @@ def extract_highlights(response: Mapping[str, object]) -> tuple[str, ...]:
     if bullet_lines:
         return tuple(bullet_lines[:5])
 
-    sentences = [frag.strip() for frag in re.split(r"[.!?]\s+", answer) if frag.strip()]
+    sentences = [
+        frag.strip() for frag in _SENTENCE_SPLIT.split(answer) if frag.strip()
+    ]
     return tuple(sentences[:3])
 
 
@@ -131,6 +146,6 @@ def synopsis_from_answer(answer: str) -> str | None:
     text = answer.strip()
     if not text:
         return None
-    sentences = re.split(r"[.!?]\s+", text, maxsplit=1)
+    sentences = _SENTENCE_SPLIT.split(text, maxsplit=1)
     first_sentence = sentences[0].strip()
     return first_sentence[:240] if first_sentence else None
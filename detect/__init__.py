@@ -1,12 +1,22 @@
-"""Detection utilities for runnable entrypoints."""
+"""Detection utilities for runnable entrypoints.
 
-from .entrypoints import (
-    DEFAULT_EXCLUDE_DIRS,
-    DEFAULT_NAME_PATTERNS,
-    EntryPointCandidate,
-    EntryPointDiscovery,
-    scan_python_entrypoints,
-)
+Re-exports resolve lazily (PEP 562) so importing the package does not
+compile the scanner's regexes until a caller actually needs them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .entrypoints import (
+        DEFAULT_EXCLUDE_DIRS,
+        DEFAULT_NAME_PATTERNS,
+        EntryPointCandidate,
+        EntryPointDiscovery,
+        scan_python_entrypoints,
+    )
 
 __all__ = [
     "DEFAULT_EXCLUDE_DIRS",
@@ -15,3 +25,17 @@ __all__ = [
     "EntryPointDiscovery",
     "scan_python_entrypoints",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(".entrypoints", __name__)
+    value: object = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
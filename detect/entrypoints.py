@@ -2,22 +2,58 @@
 
 from __future__ import annotations
 
-import hashlib
+import heapq
+import mmap
+import os
 import re
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
-    from pathlib import Path
-
-DEFAULT_NAME_PATTERNS: tuple[re.Pattern[str], ...] = (
-    re.compile(r"^run_[a-z0-9_]+\.py$", re.IGNORECASE),
-    re.compile(r"^[a-z0-9_]+_cli\.py$", re.IGNORECASE),
-    re.compile(r"^cli_[a-z0-9_]+\.py$", re.IGNORECASE),
-    re.compile(r"^main\.py$", re.IGNORECASE),
-    re.compile(r"^__main__\.py$"),
-)
+    from typing import BinaryIO
+
+    # Materialized lazily through the module __getattr__ below.
+    DEFAULT_NAME_PATTERNS: tuple[re.Pattern[str], ...]
+
+
+@cache
+def _default_patterns() -> tuple[re.Pattern[str], ...]:
+    """Compile the default name patterns on first use, not at import."""
+
+    return (
+        re.compile(r"^run_[a-z0-9_]+\.py$", re.IGNORECASE),
+        re.compile(r"^[a-z0-9_]+_cli\.py$", re.IGNORECASE),
+        re.compile(r"^cli_[a-z0-9_]+\.py$", re.IGNORECASE),
+        re.compile(r"^main\.py$", re.IGNORECASE),
+        re.compile(r"^__main__\.py$"),
+    )
+
+
+@cache
+def _combined_name_re() -> re.Pattern[str]:
+    """Single-scan alternation equivalent to the default name patterns.
+
+    Kept in sync with :func:`_default_patterns` so the default case needs
+    one match attempt instead of five.
+    """
+
+    return re.compile(
+        r"^(?:run_[a-z0-9_]+|[a-z0-9_]+_cli|cli_[a-z0-9_]+|main|__main__)\.py$",
+        re.IGNORECASE,
+    )
+
+
+def __getattr__(name: str) -> object:
+    if name == "DEFAULT_NAME_PATTERNS":
+        patterns = _default_patterns()
+        globals()[name] = patterns
+        return patterns
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset(
     {
@@ -40,8 +76,7 @@ DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset(
 )
 
 
-@dataclass(slots=True)
-class EntryPointCandidate:
+class EntryPointCandidate(NamedTuple):
     """Potential runnable entrypoint discovered by heuristics."""
 
     path: str
@@ -54,8 +89,7 @@ class EntryPointCandidate:
     import_hints: tuple[str, ...]
 
 
-@dataclass(slots=True)
-class EntryPointDiscovery:
+class EntryPointDiscovery(NamedTuple):
     """Container for discovery results."""
 
     root: str
@@ -64,128 +98,260 @@ class EntryPointDiscovery:
 
 
 def _iter_python_files(root: Path, *, exclude_dirs: frozenset[str]) -> Iterator[Path]:
-    stack: list[Path] = [root]
+    # os.scandir reuses the directory entry's type info, avoiding a stat()
+    # per child, and str paths keep Path construction off excluded entries.
+    stack: list[str] = [str(root)]
     while stack:
         current = stack.pop()
         try:
-            iterator = current.iterdir()
+            entries = os.scandir(current)
         except OSError:
             continue
-        for entry in iterator:
-            name = entry.name
-            if entry.is_dir():
-                if name in exclude_dirs or name.startswith("."):
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
                     continue
-                stack.append(entry)
-                continue
-            if entry.suffix.lower() == ".py":
-                yield entry
+                if is_dir:
+                    if name in exclude_dirs or name.startswith("."):
+                        continue
+                    stack.append(entry.path)
+                    continue
+                if name.lower().endswith(".py"):
+                    yield Path(entry.path)
 
 
-def _read_text_prefix(path: Path, limit: int = 65_536) -> str:
-    try:
-        data = path.read_bytes()
-    except OSError:
-        return ""
-    return data[:limit].decode("utf-8", "ignore")
+_PREFIX_LIMIT = 65_536
+# Above this size, hash via a single mmap'd buffer instead of chunked reads.
+_MMAP_HASH_THRESHOLD = 1 << 20
 
 
-def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    try:
-        with path.open("rb") as handle:
-            while chunk := handle.read(8192):
-                h.update(chunk)
-    except OSError:
-        return ""
-    return h.hexdigest()
+def _hash_remainder(handle: BinaryIO, prefix: bytes, size_bytes: int) -> str:
+    """SHA-256 an open file whose first *prefix* bytes are already read."""
+
+    import hashlib  # deferred: type-only importers of this module skip it
+
+    if size_bytes > _MMAP_HASH_THRESHOLD:
+        # One contiguous buffer lets hashlib consume the file in a single
+        # C call and leaves readahead to the kernel.
+        try:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        except (OSError, ValueError):
+            # mmap unsupported (pipes, some network filesystems): fall back.
+            handle.seek(len(prefix))
+    hasher = hashlib.sha256(prefix)
+    while chunk := handle.read(_PREFIX_LIMIT):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+_MAIN_GUARD = re.compile(r"if __name__ == ['\"]__main__['\"]")
+_IMPORT_HINT = re.compile(r"\b(argparse|click|typer|fire)\b")
+# regex matches return fresh str objects; map them back onto interned
+# singletons so thousands of candidates share the same hint pointers.
+_HINT_INTERN: dict[str, str] = {
+    hint: sys.intern(hint) for hint in ("argparse", "click", "typer", "fire")
+}
 
 
 def _main_guard_present(text: str) -> bool:
-    return 'if __name__ == "__main__"' in text or "if __name__ == '__main__'" in text
+    return _MAIN_GUARD.search(text) is not None
 
 
 def _shebang_present(text: str) -> bool:
-    lines = text.splitlines()
-    if not lines:
+    # Only the first line matters; don't splitlines() the whole prefix.
+    if not text.startswith("#!/"):
         return False
-    first = lines[0]
-    return first.startswith("#!/") and "python" in first.lower()
+    newline = text.find("\n")
+    first = text[: newline if newline >= 0 else 256]
+    return "python" in first.lower()
 
 
 def _import_hints(text: str) -> tuple[str, ...]:
-    hints: list[str] = []
-    if "argparse" in text:
-        hints.append("argparse")
-    if "click" in text:
-        hints.append("click")
-    if "typer" in text:
-        hints.append("typer")
-    if "fire" in text:
-        hints.append("fire")
-    return tuple(sorted(set(hints)))
+    found = {_HINT_INTERN.get(hint, hint) for hint in _IMPORT_HINT.findall(text)}
+    return tuple(sorted(found))
 
 
 def _name_based_reasons(
     path: Path, *, patterns: Sequence[re.Pattern[str]]
 ) -> list[str]:
     name = path.name
-    reasons = [
-        f"name matches {pattern.pattern}" for pattern in patterns if pattern.match(name)
-    ]
-    if path.stem.endswith("_runner"):
-        reasons.append("name ends with _runner")
-    if "run" in path.stem:
+    if tuple(patterns) == _default_patterns():
+        reasons = (
+            ["name matches entrypoint pattern"]
+            if _combined_name_re().match(name)
+            else []
+        )
+    else:
+        reasons = [
+            f"name matches {pattern.pattern}"
+            for pattern in patterns
+            if pattern.match(name)
+        ]
+    # One substring scan covers both stem heuristics: a "_runner" suffix
+    # necessarily contains "run", so the suffix check nests inside the hit.
+    stem = path.stem
+    if "run" in stem:
+        if stem.endswith("_runner"):
+            reasons.append("name ends with _runner")
         reasons.append("stem contains 'run'")
     return reasons
 
 
+# Below this many files the process-spawn overhead outweighs the win.
+_PARALLEL_SCAN_THRESHOLD = 200
+
+
+def _candidate_rank(candidate: EntryPointCandidate) -> tuple[float, str]:
+    return (-candidate.score, candidate.path)
+
+# (path, root, patterns, mtime_ns, size) -> prior evaluation, so repeated
+# scans in a watcher/CI loop skip re-reading and re-hashing unchanged files.
+_CandidateCacheKey = tuple[str, str, tuple["re.Pattern[str]", ...], int, int]
+_CANDIDATE_CACHE: dict[_CandidateCacheKey, EntryPointCandidate | None] = {}
+
+
+def _evaluate_file(
+    file_path: Path,
+    absolute_root: Path,
+    patterns: tuple[re.Pattern[str], ...],
+) -> EntryPointCandidate | None:
+    try:
+        stat_result = file_path.stat()
+    except OSError:
+        stat_result = None
+    cache_key: _CandidateCacheKey | None = None
+    if stat_result is not None:
+        cache_key = (
+            str(file_path),
+            str(absolute_root),
+            patterns,
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
+        if cache_key in _CANDIDATE_CACHE:
+            return _CANDIDATE_CACHE[cache_key]
+    candidate = _evaluate_file_uncached(
+        file_path,
+        absolute_root,
+        patterns,
+        size_bytes=stat_result.st_size if stat_result is not None else 0,
+    )
+    if cache_key is not None:
+        _CANDIDATE_CACHE[cache_key] = candidate
+    return candidate
+
+
+def _evaluate_file_uncached(
+    file_path: Path,
+    absolute_root: Path,
+    patterns: tuple[re.Pattern[str], ...],
+    *,
+    size_bytes: int,
+) -> EntryPointCandidate | None:
+    # Name heuristics are cheap; run them before touching file contents.
+    reasons = _name_based_reasons(file_path, patterns=patterns)
+    has_main_guard = False
+    has_shebang = False
+    import_hints: tuple[str, ...] = ()
+    digest = ""
+    # One open serves both the heuristics prefix and (for survivors) the
+    # hash, so candidate files are read exactly once.
+    try:
+        with file_path.open("rb") as handle:
+            prefix = handle.read(_PREFIX_LIMIT)
+            text = prefix.decode("utf-8", "ignore")
+            if text:
+                has_main_guard = _main_guard_present(text)
+                has_shebang = _shebang_present(text)
+                import_hints = _import_hints(text)
+            if has_main_guard:
+                reasons.append("contains __main__ guard")
+            if has_shebang:
+                reasons.append("has python shebang")
+            if import_hints:
+                reasons.append(f"imports {', '.join(import_hints)}")
+            if not reasons:
+                return None
+            digest = _hash_remainder(handle, prefix, size_bytes)
+    except OSError:
+        # Unreadable mid-way: keep whatever signal we gathered, as before.
+        if not reasons:
+            return None
+    score = 1.0 + 0.5 * (len(reasons) - 1)
+    return EntryPointCandidate(
+        path=str(file_path.relative_to(absolute_root)),
+        score=score,
+        reasons=tuple(reasons),
+        size_bytes=size_bytes,
+        sha256=digest,
+        has_main_guard=has_main_guard,
+        has_shebang=has_shebang,
+        import_hints=import_hints,
+    )
+
+
+def _evaluate_batch(
+    paths: Sequence[str],
+    root: str,
+    patterns: tuple[re.Pattern[str], ...],
+) -> list[EntryPointCandidate]:
+    """Worker-side evaluation of one shard of the discovered file list."""
+
+    absolute_root = Path(root)
+    results: list[EntryPointCandidate] = []
+    for path in paths:
+        candidate = _evaluate_file(Path(path), absolute_root, patterns)
+        if candidate is not None:
+            results.append(candidate)
+    return results
+
+
 def scan_python_entrypoints(
     root: Path,
     *,
     name_patterns: Sequence[re.Pattern[str]] | None = None,
     exclude_dirs: frozenset[str] | None = None,
+    top_k: int | None = None,
 ) -> EntryPointDiscovery:
-    """Scan *root* for Python entrypoints using heuristics."""
+    """Scan *root* for Python entrypoints using heuristics.
 
-    patterns = tuple(name_patterns or DEFAULT_NAME_PATTERNS)
+    When *top_k* is given only the best-ranked *top_k* candidates are
+    returned, via a heap-based partial sort.
+    """
+
+    patterns = tuple(name_patterns or _default_patterns())
     excludes = exclude_dirs or DEFAULT_EXCLUDE_DIRS
     absolute_root = root.resolve()
+    files = list(_iter_python_files(absolute_root, exclude_dirs=excludes))
+    total_files = len(files)
     candidates: list[EntryPointCandidate] = []
-    total_files = 0
-    for file_path in _iter_python_files(absolute_root, exclude_dirs=excludes):
-        total_files += 1
-        text = _read_text_prefix(file_path)
-        reasons = _name_based_reasons(file_path, patterns=patterns)
-        has_main_guard = _main_guard_present(text)
-        has_shebang = _shebang_present(text)
-        import_hints = _import_hints(text)
-        if has_main_guard:
-            reasons.append("contains __main__ guard")
-        if has_shebang:
-            reasons.append("has python shebang")
-        if import_hints:
-            reasons.append(f"imports {', '.join(import_hints)}")
-        if not reasons:
-            continue
-        score = 1.0 + 0.5 * (len(reasons) - 1)
-        size_bytes = 0
-        try:
-            size_bytes = file_path.stat().st_size
-        except OSError:
-            size_bytes = 0
-        candidate = EntryPointCandidate(
-            path=str(file_path.relative_to(absolute_root)),
-            score=score,
-            reasons=tuple(reasons),
-            size_bytes=size_bytes,
-            sha256=_sha256(file_path),
-            has_main_guard=has_main_guard,
-            has_shebang=has_shebang,
-            import_hints=import_hints,
-        )
-        candidates.append(candidate)
-    candidates.sort(key=lambda c: (-c.score, c.path))
+    if total_files < _PARALLEL_SCAN_THRESHOLD:
+        for file_path in files:
+            candidate = _evaluate_file(file_path, absolute_root, patterns)
+            if candidate is not None:
+                candidates.append(candidate)
+    else:
+        workers = min(os.cpu_count() or 1, 8)
+        shards: list[list[str]] = [[] for _ in range(workers)]
+        for index, file_path in enumerate(files):
+            shards[index % workers].append(str(file_path))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_evaluate_batch, shard, str(absolute_root), patterns)
+                for shard in shards
+                if shard
+            ]
+            for future in futures:
+                candidates.extend(future.result())
+    if top_k is not None:
+        # Partial sort: O(N log K) instead of sorting every candidate.
+        candidates = heapq.nsmallest(top_k, candidates, key=_candidate_rank)
+    else:
+        candidates.sort(key=_candidate_rank)
     return EntryPointDiscovery(
         root=str(absolute_root),
         candidates=tuple(candidates),
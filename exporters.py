@@ -13,8 +13,10 @@ import contextlib
 import os
 import shutil
 import subprocess
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import cast
 
@@ -45,10 +47,7 @@ def _preferred_binary(
     return None
 
 
-def _env_binary(env_var: str | None) -> Path | None:
-    if not env_var:
-        return None
-    env_value = os.environ.get(env_var)
+def _env_binary(env_value: str | None) -> Path | None:
     if not env_value:
         return None
     candidate = Path(env_value)
@@ -104,8 +103,31 @@ def _resolve_binary(
     default_candidates: Sequence[Path] | None = None,
     allow_missing_preferred: bool = False,
 ) -> Path | None:
-    """Resolve a binary path using explicit, env, and PATH lookups."""
+    """Resolve a binary path using explicit, env, and PATH lookups.
+
+    Results are memoized so batch exports pay the PATH walk and default
+    candidate stats once. The env value is part of the cache key, so
+    changing the variable is observed on the next call.
+    """
+
+    env_value = os.environ.get(env_var) if env_var else None
+    return _resolve_binary_cached(
+        str(preferred_path) if preferred_path else None,
+        env_value,
+        tuple(fallback_names),
+        tuple(default_candidates or ()),
+        allow_missing_preferred,
+    )
 
+
+@lru_cache(maxsize=None)
+def _resolve_binary_cached(
+    preferred_path: str | None,
+    env_value: str | None,
+    fallback_names: tuple[str, ...],
+    default_candidates: tuple[Path, ...],
+    allow_missing_preferred: bool,
+) -> Path | None:
     preferred = _preferred_binary(
         preferred_path,
         allow_missing=allow_missing_preferred,
@@ -113,7 +135,7 @@ def _resolve_binary(
     if preferred is not None:
         return preferred
 
-    env_candidate = _env_binary(env_var)
+    env_candidate = _env_binary(env_value)
     if env_candidate is not None:
         return env_candidate
 
@@ -129,6 +151,12 @@ def _resolve_binary(
     return None
 
 
+def clear_binary_cache() -> None:
+    """Forget memoized binary resolutions (e.g. after PATH changes)."""
+
+    _resolve_binary_cached.cache_clear()
+
+
 def _execute_command(
     command: Sequence[str],
     *,
@@ -142,12 +170,47 @@ def _execute_command(
     return run_command(tuple(command), check=False)
 
 
+def _resolve_output_dir(output_dir: Path) -> Path:
+    """Absolutize *output_dir* without stat'ing paths that are already absolute."""
+
+    # Path.resolve() walks symlinks with a stat per component; callers
+    # overwhelmingly pass absolute paths, which can be used verbatim.
+    if output_dir.is_absolute():
+        return output_dir
+    return output_dir.resolve()
+
+
+# Directories already created this process; mkdir(parents=True) stats every
+# ancestor, so batch exports into a shared tree would otherwise re-pay that
+# syscall chain per artifact.
+_MKDIR_CACHE: set[Path] = set()
+
+
+def _ensure_parent_dir(parent: Path) -> None:
+    if parent not in _MKDIR_CACHE:
+        parent.mkdir(parents=True, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+
+
 def _write_text(path: Path, content: str) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    _ensure_parent_dir(path.parent)
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+        handle.write(content)
     return path
 
 
+def _write_texts(pairs: Iterable[tuple[Path, str]]) -> list[Path]:
+    """Write many artifacts, creating each parent directory only once."""
+
+    written: list[Path] = []
+    for path, content in pairs:
+        _ensure_parent_dir(path.parent)
+        with path.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+            handle.write(content)
+        written.append(path)
+    return written
+
+
 def export_markdown_to_pdf(  # noqa: PLR0913 - explicit parameters aid clarity
     markdown_text: str,
     *,
@@ -162,7 +225,7 @@ def export_markdown_to_pdf(  # noqa: PLR0913 - explicit parameters aid clarity
     """Render Markdown to PDF using wkhtmltopdf."""
 
     exporter_name = "markdown->pdf"
-    output_dir = output_dir.resolve()
+    output_dir = _resolve_output_dir(output_dir)
     markdown_path = _write_text(output_dir / f"{stem}.md", markdown_text)
     render_md = markdown_to_html or _default_markdown_to_html
     html_content = render_md(markdown_text)
@@ -201,7 +264,7 @@ def export_html_to_pdf(  # noqa: PLR0913 - explicit parameters aid clarity
     """Render raw HTML to PDF using wkhtmltopdf."""
 
     exporter_name = "html->pdf"
-    output_dir = output_dir.resolve()
+    output_dir = _resolve_output_dir(output_dir)
     html_path = _write_text(output_dir / f"{stem}.html", html_text)
     binary = _resolve_binary(
         preferred_path=wkhtmltopdf_path,
@@ -223,6 +286,51 @@ def export_html_to_pdf(  # noqa: PLR0913 - explicit parameters aid clarity
     )
 
 
+def export_many_html_to_pdf(
+    items: Sequence[tuple[str, str]],
+    *,
+    output_dir: Path,
+    wkhtmltopdf_path: str | os.PathLike[str] | None = None,
+    runner: CommandRunner | None = None,
+    extra_args: Sequence[str] | None = None,
+    keep_html: bool = True,
+) -> list[ExportResult]:
+    """Render many ``(stem, html_text)`` pairs to PDF in one batch.
+
+    All HTML sources are written up front and the wkhtmltopdf binary is
+    resolved once for the whole batch. wkhtmltopdf accepts only a single
+    output document per invocation, so rendering still runs one process
+    per pair; use :func:`export_batch` to fan those out across cores.
+    """
+
+    output_dir = _resolve_output_dir(output_dir)
+    html_paths = _write_texts(
+        (output_dir / f"{stem}.html", html_text) for stem, html_text in items
+    )
+    binary = _resolve_binary(
+        preferred_path=wkhtmltopdf_path,
+        env_var="X_WKHTMLTOPDF_PATH",
+        fallback_names=("wkhtmltopdf", "wkhtmltopdf.exe"),
+        default_candidates=_DEFAULT_WKHTMLTOPDF_CANDIDATES,
+        allow_missing_preferred=runner is not None,
+    )
+    results: list[ExportResult] = []
+    for (stem, _html_text), html_path in zip(items, html_paths, strict=True):
+        results.append(
+            _run_wkhtmltopdf(
+                exporter="html->pdf",
+                binary=binary,
+                html_path=html_path,
+                pdf_path=output_dir / f"{stem}.pdf",
+                inputs={"html": html_path},
+                runner=runner,
+                extra_args=extra_args,
+                keep_html=keep_html,
+            )
+        )
+    return results
+
+
 def export_graphviz_to_svg(  # noqa: PLR0913 - explicit parameters aid clarity
     dot_source: str,
     *,
@@ -237,7 +345,7 @@ def export_graphviz_to_svg(  # noqa: PLR0913 - explicit parameters aid clarity
     """Render Graphviz DOT source to SVG using the ``dot`` binary."""
 
     exporter_name = "graphviz->svg"
-    output_dir = output_dir.resolve()
+    output_dir = _resolve_output_dir(output_dir)
     dot_path = dot_path or output_dir / f"{stem}.dot"
     _write_text(dot_path, dot_source)
     binary = _resolve_binary(
@@ -301,7 +409,7 @@ def export_mermaid_to_svg(  # noqa: PLR0913 - explicit parameters aid clarity
     """Render Mermaid source to SVG using ``mmdc`` (mermaid-cli)."""
 
     exporter_name = "mermaid->svg"
-    output_dir = output_dir.resolve()
+    output_dir = _resolve_output_dir(output_dir)
     mmd_path = _write_text(output_dir / f"{stem}.mmd", mermaid_source)
     binary = _resolve_binary(
         preferred_path=mermaid_cli_path,
@@ -347,8 +455,82 @@ def export_mermaid_to_svg(  # noqa: PLR0913 - explicit parameters aid clarity
     )
 
 
-def _default_markdown_to_html(markdown_text: str) -> str:
-    """Render Markdown to HTML using python-markdown when available."""
+# Kind tag -> exporter, for pickled dispatch across process boundaries.
+ExportJob = tuple[str, dict[str, object]]
+
+
+def _dispatch(job: ExportJob) -> ExportResult:
+    """Run a single ``(kind, kwargs)`` export job."""
+
+    kind, kwargs = job
+    exporter = _EXPORT_DISPATCH.get(kind)
+    if exporter is None:
+        msg = f"unknown export job kind: {kind!r}"
+        raise ValueError(msg)
+    return exporter(**kwargs)
+
+
+def export_batch(
+    jobs: Iterable[ExportJob],
+    *,
+    max_workers: int | None = None,
+) -> list[ExportResult]:
+    """Run independent export jobs in parallel worker processes.
+
+    Each job is a ``(kind, kwargs)`` pair where *kind* names one of the
+    exporters ("markdown->pdf", "html->pdf", "graphviz->svg",
+    "mermaid->svg") and *kwargs* must be picklable — in particular,
+    custom ``runner`` callables must be module-level functions. Results
+    come back in job order. *max_workers* caps the pool; oversizing it
+    regresses from context switching, so the default stays at the
+    smaller of the CPU count and the job count.
+    """
+
+    job_list = list(jobs)
+    if not job_list:
+        return []
+    workers = max_workers or min(os.cpu_count() or 1, len(job_list))
+    if workers <= 1 or len(job_list) == 1:
+        return [_dispatch(job) for job in job_list]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_dispatch, job_list))
+
+
+_ASYNC_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _async_executor() -> ThreadPoolExecutor:
+    # Threads suffice here: exporter jobs block in subprocesses, so the
+    # GIL is released while the external binary does the work.
+    global _ASYNC_EXECUTOR  # noqa: PLW0603 - shared lazily-built pool
+    if _ASYNC_EXECUTOR is None:
+        _ASYNC_EXECUTOR = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="exporters",
+        )
+    return _ASYNC_EXECUTOR
+
+
+def submit_export(job: ExportJob) -> Future[ExportResult]:
+    """Run a ``(kind, kwargs)`` export job without blocking the caller.
+
+    Returns a future resolving to the job's :class:`ExportResult`; fan out
+    several submissions and collect them with ``as_completed``. Jobs run
+    on a shared thread pool, so unlike :func:`export_batch` the *kwargs*
+    (including ``runner``) need not be picklable.
+    """
+
+    return _async_executor().submit(_dispatch, job)
+
+
+def _pre_wrapper_html(markdown_text: str) -> str:
+    escaped = markdown_text.replace("<", "&lt;").replace(">", "&gt;")
+    return f"<pre>{escaped}</pre>"
+
+
+@cache
+def _get_markdown_renderer() -> Callable[[str], str]:
+    """Resolve the Markdown renderer once: python-markdown or a <pre> shim."""
 
     try:
         module = __import__("markdown")
@@ -356,13 +538,22 @@ def _default_markdown_to_html(markdown_text: str) -> str:
             "Callable[[str], object] | None",
             getattr(module, "markdown", None),
         )
-        if renderer is not None:
-            rendered = renderer(markdown_text or "")
-            return str(rendered)
     except Exception:  # noqa: BLE001 - fall through to minimal HTML
+        renderer = None
+    if renderer is None:
         log_info("python-markdown unavailable; falling back to <pre> wrapper for HTML")
-    escaped = (markdown_text or "").replace("<", "&lt;").replace(">", "&gt;")
-    return f"<pre>{escaped}</pre>"
+        return _pre_wrapper_html
+
+    def _render(markdown_text: str) -> str:
+        return str(renderer(markdown_text))
+
+    return _render
+
+
+def _default_markdown_to_html(markdown_text: str) -> str:
+    """Render Markdown to HTML using python-markdown when available."""
+
+    return _get_markdown_renderer()(markdown_text or "")
 
 
 def _run_wkhtmltopdf(  # noqa: PLR0913 - explicit options keep callsites obvious
@@ -419,11 +610,24 @@ def _run_wkhtmltopdf(  # noqa: PLR0913 - explicit options keep callsites obvious
     )
 
 
+_EXPORT_DISPATCH: dict[str, Callable[..., ExportResult]] = {
+    "markdown->pdf": export_markdown_to_pdf,
+    "html->pdf": export_html_to_pdf,
+    "graphviz->svg": export_graphviz_to_svg,
+    "mermaid->svg": export_mermaid_to_svg,
+}
+
+
 __all__ = [
     "CommandRunner",
+    "ExportJob",
     "ExportResult",
+    "clear_binary_cache",
+    "export_batch",
     "export_graphviz_to_svg",
     "export_html_to_pdf",
+    "export_many_html_to_pdf",
     "export_markdown_to_pdf",
     "export_mermaid_to_svg",
+    "submit_export",
 ]
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import contextlib
-import json
+import sys
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import cast
 
+from . import _json_codec
+from .json_contracts import ValidationErrorType, validate_payload
+
 __all__ = ["BoardState", "CardRecord", "dump_board", "load_board", "save_board"]
 
 
@@ -23,16 +25,33 @@ class CardRecord:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     description: str | None = None
+    _cached_json: dict[str, object] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Any field write drops the cached payload so direct mutation
+        # (card.title = ...) can never save stale data.
+        object.__setattr__(self, name, value)
+        if name != "_cached_json":
+            object.__setattr__(self, "_cached_json", None)
 
     def to_json(self) -> dict[str, object]:
-        return {
-            "id": self.card_id,
-            "title": self.title,
-            "status": self.status,
-            "description": self.description,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        # Rebuilt lazily; field writes drop the cache so untouched cards
+        # keep reusing one payload across saves. Returned as a copy so
+        # callers mutating the result cannot poison the cache.
+        cached = self._cached_json
+        if cached is None:
+            cached = {
+                "id": self.card_id,
+                "title": self.title,
+                "status": self.status,
+                "description": self.description,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+            }
+            self._cached_json = cached
+        return dict(cached)
 
     @classmethod
     def from_json(cls, payload: Mapping[str, object]) -> CardRecord:
@@ -51,10 +70,13 @@ class CardRecord:
         description = description_obj if isinstance(description_obj, str) else None
         created_at = _coerce_timestamp(payload.get("created_at"))
         updated_at = _coerce_timestamp(payload.get("updated_at"))
+        # Statuses come from a tiny vocabulary and ids are shared across
+        # snapshots; interning collapses the parse-fresh copies to one
+        # object each and makes downstream comparisons pointer checks.
         return cls(
-            card_id=card_id_obj.strip(),
+            card_id=sys.intern(card_id_obj.strip()),
             title=title_obj.strip(),
-            status=status or "Backlog",
+            status=sys.intern(status or "Backlog"),
             created_at=created_at,
             updated_at=updated_at,
             description=description,
@@ -62,19 +84,69 @@ class CardRecord:
 
 
 def _coerce_timestamp(value: object) -> datetime:
+    # Called twice per card on load; a bare try/except is cheaper than the
+    # contextlib.suppress context-manager frame on this hot path.
     if isinstance(value, str) and value:
-        with contextlib.suppress(ValueError):
+        try:
             return datetime.fromisoformat(value)
+        except ValueError:
+            pass
     return datetime.now(UTC)
 
 
+# Shape of a well-formed board file; the pattern constraints guarantee id
+# and title survive strip(), letting the load fast path skip per-field checks.
+_CARD_LIST_SCHEMA: dict[str, object] = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "pattern": r"\S"},
+            "title": {"type": "string", "pattern": r"\S"},
+            "status": {"type": "string"},
+            "description": {"type": ["string", "null"]},
+            "created_at": {"type": "string"},
+            "updated_at": {"type": "string"},
+        },
+        "required": ["id", "title"],
+    },
+}
+
+
+def _card_from_valid(payload: Mapping[str, object]) -> CardRecord:
+    """Build a card from an entry already validated against the schema."""
+
+    status_obj = payload.get("status")
+    return CardRecord(
+        card_id=sys.intern(cast("str", payload["id"]).strip()),
+        title=cast("str", payload["title"]).strip(),
+        status=sys.intern(
+            cast("str", status_obj).strip() or "Backlog"
+            if isinstance(status_obj, str)
+            else "Backlog"
+        ),
+        created_at=_coerce_timestamp(payload.get("created_at")),
+        updated_at=_coerce_timestamp(payload.get("updated_at")),
+        description=cast("str | None", payload.get("description")),
+    )
+
+
 def _empty_board() -> dict[str, CardRecord]:
     return {}
 
 
+def _updated_key(card: CardRecord) -> datetime:
+    return card.updated_at
+
+
 @dataclass(slots=True)
 class BoardState:
-    """In-memory board where mutations are mirrored back into JSON."""
+    """In-memory board where mutations are mirrored back into JSON.
+
+    ``cards`` keeps its insertion order aligned with ``updated_at``:
+    mutations stamp ``now()`` and (re)insert at the end, and the load
+    helpers insert pre-sorted, so serialization never needs to sort.
+    """
 
     cards: dict[str, CardRecord] = field(default_factory=_empty_board)
 
@@ -96,6 +168,8 @@ class BoardState:
         original = self.cards[key]
         record.created_at = original.created_at
         record.updated_at = datetime.now(UTC)
+        # Re-insert at the end so dict order keeps tracking updated_at.
+        del self.cards[key]
         self.cards[key] = record
 
     def remove(self, card_id: str) -> CardRecord:
@@ -109,43 +183,59 @@ class BoardState:
         return list(self.cards.values())
 
     def to_json(self) -> list[dict[str, object]]:
-        def _updated_key(card: CardRecord) -> datetime:
-            return card.updated_at
-
-        ordered = sorted(self.cards.values(), key=_updated_key)
-        return [card.to_json() for card in ordered]
+        # Dict order already matches updated_at (see class docstring), so
+        # serialization is a single O(N) walk rather than a sort per save.
+        return [card.to_json() for card in self.cards.values()]
 
 
 def load_board(path: Path | str) -> BoardState:
     path_obj = Path(path)
     if not path_obj.exists():
         return BoardState()
-    payload_obj: object = json.loads(path_obj.read_text(encoding="utf-8"))
+    payload_obj: object = _json_codec.loads(path_obj.read_bytes())
     if not isinstance(payload_obj, list):
         msg = "Board JSON must be a list of card objects"
         raise TypeError(msg)
-    state = BoardState()
     payload_list = cast("list[object]", payload_obj)
-    for entry in payload_list:
-        if isinstance(entry, Mapping):
-            mapping_entry = cast("Mapping[str, object]", entry)
-            record = CardRecord.from_json(mapping_entry)
-            state.cards[record.card_id] = record
-    return state
+    try:
+        # One compiled-validator pass over the whole list replaces the
+        # per-entry isinstance/strip checking in CardRecord.from_json.
+        validate_payload(payload_list, _CARD_LIST_SCHEMA)
+    except ValidationErrorType:
+        records = [
+            CardRecord.from_json(cast("Mapping[str, object]", entry))
+            for entry in payload_list
+            if isinstance(entry, Mapping)
+        ]
+    else:
+        records = [
+            _card_from_valid(entry)
+            for entry in cast("list[Mapping[str, object]]", payload_list)
+        ]
+    # Sort once on load so the dict-order invariant holds from the start;
+    # building the dict in one comprehension lets it size itself upfront.
+    records.sort(key=_updated_key)
+    return BoardState(cards={record.card_id: record for record in records})
 
 
 def dump_board(state: BoardState) -> list[dict[str, object]]:
     return state.to_json()
 
 
-def save_board(path: Path | str, state: BoardState) -> None:
-    serialized: str = json.dumps(dump_board(state), indent=2, sort_keys=False)
-    Path(path).write_text(serialized, encoding="utf-8")
+def save_board(path: Path | str, state: BoardState, *, pretty: bool = False) -> None:
+    """Persist *state* as JSON; compact by default, indented when *pretty*.
+
+    The per-card payload memo on :class:`CardRecord` already makes
+    repeat saves cheap; serialization itself runs every call so the
+    bytes on disk always reflect the current state.
+    """
+
+    serialized = _json_codec.dumps_bytes(dump_board(state), indent_2=pretty)
+    Path(path).write_bytes(serialized)
 
 
 def board_from_records(records: Iterable[Mapping[str, object]]) -> BoardState:
-    state = BoardState()
-    for entry in records:
-        record = CardRecord.from_json(entry)
-        state.cards[record.card_id] = record
-    return state
+    parsed = sorted(
+        (CardRecord.from_json(entry) for entry in records), key=_updated_key
+    )
+    return BoardState(cards={record.card_id: record for record in parsed})
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import importlib
-from collections.abc import Mapping, MutableMapping
+import json
+from collections.abc import Callable, Mapping, MutableMapping
+from functools import lru_cache
 from typing import Protocol, cast
 
 SchemaMapping = Mapping[str, object]
 MutableSchemaMapping = MutableMapping[str, object]
 
+_CompiledValidator = Callable[[object], object]
+
 
 class _DraftValidator(Protocol):
     """Subset of the Draft 2020-12 validator API we rely on."""
@@ -21,6 +25,16 @@ class _DraftValidator(Protocol):
     def validate(self, payload: object) -> None: ...
 
 
+class _FastJsonSchemaModule(Protocol):
+    """Subset of the fastjsonschema API we rely on."""
+
+    JsonSchemaException: type[Exception]
+
+    def compile(  # noqa: A003 - mirrors the fastjsonschema name
+        self, definition: Mapping[str, object]
+    ) -> _CompiledValidator: ...
+
+
 def _load_draft_validator() -> type[_DraftValidator]:
     """Resolve the jsonschema Draft 2020-12 validator without requiring stubs."""
 
@@ -34,7 +48,102 @@ def _load_draft_validator() -> type[_DraftValidator]:
     return validators_module.Draft202012Validator
 
 
+def _load_validation_error() -> type[Exception]:
+    """Resolve the jsonschema ValidationError type without requiring stubs."""
+
+    class _ExceptionsModule(Protocol):
+        ValidationError: type[Exception]
+
+    exceptions_module = cast(
+        "_ExceptionsModule",
+        importlib.import_module("jsonschema.exceptions"),
+    )
+    return exceptions_module.ValidationError
+
+
+def _load_fastjsonschema() -> _FastJsonSchemaModule | None:
+    """Import fastjsonschema when available; compiled validation is optional."""
+
+    try:
+        module = importlib.import_module("fastjsonschema")
+    except ImportError:
+        return None
+    return cast("_FastJsonSchemaModule", module)
+
+
 _DRAFT_VALIDATOR: type[_DraftValidator] = _load_draft_validator()
+_VALIDATION_ERROR: type[Exception] = _load_validation_error()
+_FASTJSONSCHEMA: _FastJsonSchemaModule | None = _load_fastjsonschema()
+
+# Public alias so callers can catch validation failures without importing
+# jsonschema (and working around its missing stubs) themselves.
+ValidationErrorType: type[Exception] = _VALIDATION_ERROR
+
+
+# Draft 2020-12 keywords fastjsonschema (2.22) compiles but silently
+# ignores; validating through it would accept payloads the baseline
+# Draft202012Validator rejects, so such schemas must take the fallback.
+_FASTJSONSCHEMA_UNSUPPORTED: frozenset[str] = frozenset(
+    {
+        "$dynamicAnchor",
+        "$dynamicRef",
+        "$recursiveAnchor",
+        "$recursiveRef",
+        "dependentRequired",
+        "dependentSchemas",
+        "maxContains",
+        "minContains",
+        "prefixItems",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    }
+)
+
+
+def _uses_unsupported(node: object) -> bool:
+    # A property *named* like an unsupported keyword false-positives here,
+    # which only costs the fallback to jsonschema — the safe direction.
+    if isinstance(node, Mapping):
+        mapping = cast("Mapping[object, object]", node)
+        return any(
+            key in _FASTJSONSCHEMA_UNSUPPORTED or _uses_unsupported(value)
+            for key, value in mapping.items()
+        )
+    if isinstance(node, list):
+        items = cast("list[object]", node)
+        return any(_uses_unsupported(item) for item in items)
+    return False
+
+
+@lru_cache(maxsize=None)
+def _compile(schema_key: str) -> _CompiledValidator | None:
+    """Compile *schema_key* via fastjsonschema, or ``None`` when it can't.
+
+    ``None`` means the schema is uncompilable or uses keywords the
+    compiled path would silently skip; callers fall back to jsonschema.
+    """
+
+    if _FASTJSONSCHEMA is None:  # pragma: no cover - guarded by callers
+        return None
+    schema = cast("dict[str, object]", json.loads(schema_key))
+    if _uses_unsupported(schema):
+        return None
+    try:
+        return _FASTJSONSCHEMA.compile(schema)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _compile_draft(schema_key: str) -> _DraftValidator:
+    """Build a reusable Draft 2020-12 validator for *schema_key*."""
+
+    schema = cast("dict[str, object]", json.loads(schema_key))
+    return _DRAFT_VALIDATOR(schema)
+
+
+def _schema_key(schema: SchemaMapping | MutableSchemaMapping) -> str:
+    return json.dumps(dict(schema), sort_keys=True, separators=(",", ":"))
 
 
 def validate_schema(schema: SchemaMapping | MutableSchemaMapping) -> None:
@@ -43,13 +152,73 @@ def validate_schema(schema: SchemaMapping | MutableSchemaMapping) -> None:
     _DRAFT_VALIDATOR.check_schema(dict(schema))
 
 
+def compile_validator(
+    schema: SchemaMapping | MutableSchemaMapping,
+) -> Callable[[object], None]:
+    """Bind *schema* to a reusable validator callable, resolved once.
+
+    The returned callable raises :data:`ValidationErrorType` on invalid
+    payloads. Hot paths that check many payloads against one fixed schema
+    should call this at import time so each validation skips the schema
+    canonicalisation that :func:`validate_payload` performs per call.
+    """
+
+    try:
+        schema_key = _schema_key(schema)
+    except (TypeError, ValueError):
+        unkeyed = _DRAFT_VALIDATOR(dict(schema))
+
+        def _validate_unkeyed(payload: object) -> None:
+            unkeyed.validate(payload)
+
+        return _validate_unkeyed
+    if _FASTJSONSCHEMA is not None:
+        compiled = _compile(schema_key)
+        if compiled is not None:
+            fast_error = _FASTJSONSCHEMA.JsonSchemaException
+
+            def _validate_compiled(payload: object) -> None:
+                try:
+                    compiled(payload)
+                except fast_error as exc:
+                    raise _VALIDATION_ERROR(str(exc)) from exc
+
+            return _validate_compiled
+    draft = _compile_draft(schema_key)
+
+    def _validate_draft(payload: object) -> None:
+        draft.validate(payload)
+
+    return _validate_draft
+
+
 def validate_payload(
     payload: object, schema: SchemaMapping | MutableSchemaMapping
 ) -> None:
     """Validate *payload* against *schema* using Draft 2020-12 semantics."""
 
-    validator = _DRAFT_VALIDATOR(dict(schema))
-    validator.validate(payload)
-
-
-__all__ = ["validate_payload", "validate_schema"]
+    try:
+        schema_key = _schema_key(schema)
+    except (TypeError, ValueError):
+        # Unserializable schema: validate without the compiled caches.
+        _DRAFT_VALIDATOR(dict(schema)).validate(payload)
+        return
+    if _FASTJSONSCHEMA is not None:
+        # _compile returns None for schemas the compiled path would
+        # validate more loosely than jsonschema; those fall through.
+        validator = _compile(schema_key)
+        if validator is not None:
+            try:
+                validator(payload)
+            except _FASTJSONSCHEMA.JsonSchemaException as exc:
+                raise _VALIDATION_ERROR(str(exc)) from exc
+            return
+    _compile_draft(schema_key).validate(payload)
+
+
+__all__ = [
+    "ValidationErrorType",
+    "compile_validator",
+    "validate_payload",
+    "validate_schema",
+]
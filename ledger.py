@@ -3,14 +3,33 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from . import _json_codec
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping
     from pathlib import Path
+    from typing import BinaryIO
+
+
+# Millisecond-bucketed timestamp cache: building and formatting a datetime
+# costs hundreds of nanoseconds, so events created in a tight loop within
+# the same millisecond share one string.
+_TS_CACHE_MS: int = -1
+_TS_CACHE_STR: str = ""
+
+
+def _fast_now_iso() -> str:
+    global _TS_CACHE_MS, _TS_CACHE_STR  # noqa: PLW0603 - single-slot cache
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _TS_CACHE_MS:
+        _TS_CACHE_MS = now_ms
+        _TS_CACHE_STR = datetime.now(UTC).isoformat()
+    return _TS_CACHE_STR
 
 
 @dataclass(slots=True, frozen=True)
@@ -19,7 +38,7 @@ class LedgerEvent:
 
     event_type: str
     payload: Mapping[str, Any]
-    emitted_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    emitted_at: str = field(default_factory=_fast_now_iso)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -29,26 +48,88 @@ class LedgerEvent:
         }
 
 
+# Ledger directories already created this process; append_event builds a
+# fresh writer per call, so without this each event re-stats the ancestry.
+_MKDIR_CACHE: set[Path] = set()
+
+
 class LedgerWriter:
-    """Append-only JSONL writer that includes per-entry checksums."""
+    """Append-only JSONL writer that includes per-entry checksums.
+
+    The underlying file handle is opened lazily on first ``append`` and
+    held open (buffered) across calls; use the writer as a context
+    manager, or call :meth:`close`, to release it. Callers needing
+    crash-durability between appends can call :meth:`flush`.
+    """
 
     def __init__(self, path: Path) -> None:
         self.path = path
-        self.path.parent.mkdir(parents=True, exist_ok=True)
+        parent = path.parent
+        if parent not in _MKDIR_CACHE:
+            parent.mkdir(parents=True, exist_ok=True)
+            _MKDIR_CACHE.add(parent)
+        self._handle: BinaryIO | None = None
+
+    def __enter__(self) -> LedgerWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _ensure_handle(self) -> BinaryIO:
+        if self._handle is None:
+            self._handle = self.path.open("ab", buffering=1 << 16)
+        return self._handle
+
+    @staticmethod
+    def _entry_line(event: LedgerEvent) -> tuple[bytes, str]:
+        # Serialize straight to UTF-8 bytes; the same buffer feeds the hash
+        # and (digest spliced in) the write, with no str round-trip. The
+        # checksum is spliced into the already-serialized object instead of
+        # serializing a second dict; *body* always ends with "}".
+        body = _json_codec.dumps_bytes(event.to_dict(), sort_keys=True)
+        digest = hashlib.sha256(body).hexdigest()
+        line = b'%s,"sha256":"%s"}\n' % (body[:-1], digest.encode("ascii"))
+        return line, digest
 
     def append(self, event: LedgerEvent) -> str:
-        entry = event.to_dict()
-        serialized = json.dumps(entry, sort_keys=True, separators=(",", ":"))
-        digest = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
-        line = json.dumps({**entry, "sha256": digest})
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(line)
-            handle.write("\n")
+        line, digest = self._entry_line(event)
+        self._ensure_handle().write(line)
         return digest
 
+    def append_many(self, events: Iterable[LedgerEvent]) -> list[str]:
+        """Append many events with one write call, returning their checksums.
+
+        Lines are assembled into a single buffer so a burst of events
+        costs one ``write()`` instead of one per event.
+        """
+
+        digests: list[str] = []
+        chunks: list[bytes] = []
+        for event in events:
+            line, digest = self._entry_line(event)
+            chunks.append(line)
+            digests.append(digest)
+        if chunks:
+            self._ensure_handle().write(b"".join(chunks))
+        return digests
+
+    def flush(self) -> None:
+        """Push buffered lines to the operating system."""
+
+        if self._handle is not None:
+            self._handle.flush()
+
+    def close(self) -> None:
+        """Flush and release the underlying file handle, if open."""
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
 
 def append_event(path: Path, event_type: str, payload: Mapping[str, Any]) -> str:
     """Append a ledger event to *path*, returning the checksum."""
 
-    writer = LedgerWriter(path)
-    return writer.append(LedgerEvent(event_type=event_type, payload=payload))
+    with LedgerWriter(path) as writer:
+        return writer.append(LedgerEvent(event_type=event_type, payload=payload))
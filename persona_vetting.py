@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -22,6 +23,15 @@ class PersonaEvidence:
     reasons: tuple[str, ...] = ()
 
 
+def _normalize_strings(values: Sequence[str] | Iterable[str]) -> tuple[str, ...]:
+    # Canonical input (a tuple of plain strings) is the common adapter case;
+    # return it untouched. Otherwise let map() run the str() loop in C,
+    # interning the results so repeated tags share one object apiece.
+    if isinstance(values, tuple) and all(type(value) is str for value in values):
+        return values
+    return tuple(map(sys.intern, map(str, values)))
+
+
 class PersonaVettingError(RuntimeError):
     """Raised when a persona vetting adapter encounters a recoverable issue."""
 
@@ -49,12 +59,12 @@ class PersonaVettingService:
     ) -> PersonaEvidence:
         """Help adapters emit PersonaEvidence objects with normalized tuples."""
 
-        normalized_tags = tuple(str(tag) for tag in tags)
-        normalized_reasons = tuple(str(reason) for reason in reasons)
+        normalized_tags = _normalize_strings(tags)
+        normalized_reasons = _normalize_strings(reasons)
         return PersonaEvidence(
             persona_id=persona_id,
             score=float(score),
-            source=source,
+            source=sys.intern(source),
             display_name=display_name,
             synopsis=synopsis,
             tags=normalized_tags,
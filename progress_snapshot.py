@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import bisect
 import contextlib
 import errno
-import json
+import os
 import time
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
@@ -12,12 +13,16 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal, cast
 
+from . import _json_codec
+
 _ATOMIC_WRITE_MAX_ATTEMPTS = 5
 _ATOMIC_WRITE_RETRY_BASE_SECONDS = 0.1
 
 
 ProgressStatus = Literal["pending", "running", "attention", "completed", "blocked"]
-_VALID_STATUSES: set[str] = {"pending", "running", "attention", "completed", "blocked"}
+_VALID_STATUSES: frozenset[str] = frozenset(
+    {"pending", "running", "attention", "completed", "blocked"}
+)
 _WINDOWS_SHARING_VIOLATIONS = {5, 32}
 _POSIX_SHARING_VIOLATIONS = {errno.EACCES, errno.EPERM}
 
@@ -70,10 +75,20 @@ def _is_transient_replace_error(error: OSError) -> bool:
     return isinstance(winerror_obj, int) and winerror_obj in _WINDOWS_SHARING_VIOLATIONS
 
 
-def _atomic_write(path: Path, payload: str) -> None:
+def _atomic_write(path: Path, payload: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(payload, encoding="utf-8")
+    # Raw fd write: payload is a single pre-encoded buffer, so the
+    # BufferedWriter/TextIOWrapper stack write_bytes builds adds nothing.
+    # os.write may write fewer bytes than asked; loop so a short write
+    # can never publish a truncated snapshot via the replace below.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
     last_error: PermissionError | OSError | None = None
     for attempt in range(1, _ATOMIC_WRITE_MAX_ATTEMPTS + 1):
         try:
@@ -146,12 +161,15 @@ class ProgressStage:
         if isinstance(metadata_obj, Mapping):
             metadata = {str(key): value for key, value in metadata_obj.items()}
         updated_obj = payload.get("updated_at")
-        updated_at = _now()
+        updated_at: datetime | None = None
         if isinstance(updated_obj, str) and updated_obj:
             try:
                 updated_at = datetime.fromisoformat(updated_obj)
             except ValueError:
-                updated_at = _now()
+                updated_at = None
+        if updated_at is None:
+            # Only pay for a fresh datetime when the payload lacks one.
+            updated_at = _now()
         normalized_status = cast("ProgressStatus", status)
         return cls(
             stage_id=stage_id_obj.strip(),
@@ -169,6 +187,8 @@ class ProgressSnapshot:
     created_at: datetime = field(default_factory=_now)
     updated_at: datetime = field(default_factory=_now)
     summary: str | None = None
+    # Kept sorted via bisect on insert so to_json never re-sorts.
+    _sorted_keys: list[str] = field(default_factory=list, repr=False, compare=False)
 
     def ensure_stage(self, stage_id: str, title: str) -> ProgressStage:
         normalized_id = str(stage_id).strip()
@@ -177,7 +197,10 @@ class ProgressSnapshot:
         if stage is None:
             stage = ProgressStage(stage_id=normalized_id, title=normalized_title)
             self.stages[normalized_id] = stage
-            self.updated_at = _now()
+            bisect.insort(self._sorted_keys, normalized_id)
+            # The fresh stage already carries a default-factory timestamp;
+            # reuse it rather than calling _now() a second time.
+            self.updated_at = stage.updated_at
         elif normalized_title and stage.title != normalized_title:
             stage.title = normalized_title
         return stage
@@ -200,7 +223,10 @@ class ProgressSnapshot:
         self.updated_at = stage.updated_at
 
     def to_json(self) -> dict[str, object]:
-        ordered = [self.stages[key] for key in sorted(self.stages)]
+        if len(self._sorted_keys) != len(self.stages):
+            # Stages were added around ensure_stage; fall back to one sort.
+            self._sorted_keys = sorted(self.stages)
+        ordered = [self.stages[key] for key in self._sorted_keys]
         return {
             "schema_version": "x_make.progress/1.0",
             "created_at": self.created_at.isoformat(),
@@ -233,6 +259,7 @@ class ProgressSnapshot:
                 )
                 stage = ProgressStage.from_json(normalized_entry)
                 snapshot.stages[stage.stage_id] = stage
+        snapshot._sorted_keys = sorted(snapshot.stages)
         return snapshot
 
 
@@ -247,7 +274,7 @@ def create_progress_snapshot(
 
 def write_progress_snapshot(path: Path | str, snapshot: ProgressSnapshot) -> Path:
     path_obj = Path(path)
-    serialized = json.dumps(snapshot.to_json(), indent=2, sort_keys=False)
+    serialized = _json_codec.dumps_bytes(snapshot.to_json(), indent_2=True)
     _atomic_write(path_obj, serialized)
     return path_obj
 
@@ -256,7 +283,9 @@ def load_progress_snapshot(path: Path | str) -> ProgressSnapshot | None:
     path_obj = Path(path)
     if not path_obj.exists():
         return None
-    raw_payload: object = json.loads(path_obj.read_text(encoding="utf-8"))
+    # Bytes go straight to the codec (orjson when available); decoding to
+    # str first would traverse the UTF-8 twice.
+    raw_payload: object = _json_codec.loads(path_obj.read_bytes())
     if not isinstance(raw_payload, Mapping):
         error_invalid_payload = "progress snapshot JSON must be an object"
         raise TypeError(error_invalid_payload)
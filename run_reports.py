@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from . import _json_codec
+
 if TYPE_CHECKING:
     from collections.abc import Mapping, MutableMapping
 
@@ -41,7 +42,12 @@ def ensure_reports_dir(
 
 def isoformat_timestamp(moment: datetime | None = None) -> str:
     current = (moment or datetime.now(UTC)).replace(microsecond=0)
-    return current.isoformat().replace("+00:00", "Z")
+    rendered = current.isoformat()
+    # The common UTC case swaps the suffix by slice; naive or offset
+    # datetimes pass through untouched, matching the baseline replace.
+    if rendered.endswith("+00:00"):
+        return rendered[:-6] + "Z"
+    return rendered
 
 
 def _ensure_mapping(
@@ -60,6 +66,7 @@ def write_run_report(  # noqa: PLR0913 - explicit keyword options aid callsites
     filename: str | None = None,
     timestamp: datetime | None = None,
     reports_name: str = REPORTS_DIR_NAME,
+    copy_payload: bool = True,
 ) -> Path:
     moment = timestamp or datetime.now(UTC)
     reports_dir = ensure_reports_dir(base_dir, reports_name=reports_name)
@@ -67,12 +74,15 @@ def write_run_report(  # noqa: PLR0913 - explicit keyword options aid callsites
     resolved_filename = filename or f"{tool_slug}_run_{stamp}.json"
     report_path = reports_dir / resolved_filename
 
-    data = _ensure_mapping(payload)
+    # copy_payload=False lets callers with large, short-lived dict payloads
+    # skip the shallow copy; the tool/generated_at defaults are then set on
+    # the caller's mapping in place.
+    if not copy_payload and isinstance(payload, dict):
+        data = payload
+    else:
+        data = _ensure_mapping(payload)
     data.setdefault("tool", tool_slug)
     data.setdefault("generated_at", isoformat_timestamp(moment))
 
-    report_path.write_text(
-        json.dumps(data, indent=2, sort_keys=False),
-        encoding="utf-8",
-    )
+    report_path.write_bytes(_json_codec.dumps_bytes(data, indent_2=True))
     return report_path
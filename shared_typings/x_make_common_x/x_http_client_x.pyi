@@ -1,11 +1,14 @@
 from collections.abc import Iterable, Mapping
+from typing import IO, NamedTuple
 
-class HttpResponse:
+class HttpResponse(NamedTuple):
     status_code: int
-    text: str
+    content: bytes
     json: object | None
+    encoding: str | None = ...
 
-    def __init__(self, status_code: int, text: str, json: object | None) -> None: ...
+    @property
+    def text(self) -> str: ...
 
 class HttpError(RuntimeError): ...
 
@@ -30,6 +33,15 @@ class HttpClient:
         params: Mapping[str, object] | Iterable[tuple[str, object]] | None = ...,
         allowed_status_codes: Iterable[int] | None = ...,
     ) -> HttpResponse: ...
+    def stream_get(
+        self,
+        url: str,
+        *,
+        sink: IO[bytes],
+        headers: Mapping[str, str] | Iterable[tuple[str, str]] | None = ...,
+        params: Mapping[str, object] | Iterable[tuple[str, object]] | None = ...,
+        chunk_size: int = ...,
+    ) -> int: ...
     def head(
         self,
         url: str,
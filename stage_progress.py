@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
-import json
 import os
 import re
 import shutil
 import tempfile
 import time
-from collections.abc import Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Protocol
+from typing import IO, Protocol, cast
+
+from . import _json_codec
 
 __all__ = [
     "RepoProgressReporter",
@@ -22,20 +25,25 @@ __all__ = [
     "StageProgressWriter",
 ]
 
-_ALLOWED_STATUSES: set[str] = {
-    "pending",
-    "running",
-    "completed",
-    "attention",
-    "blocked",
-    "skipped",
-}
-_COMPLETION_STATUSES = {"completed", "attention", "blocked", "skipped"}
+_ALLOWED_STATUSES: frozenset[str] = frozenset(
+    {
+        "pending",
+        "running",
+        "completed",
+        "attention",
+        "blocked",
+        "skipped",
+    }
+)
+_COMPLETION_STATUSES = frozenset({"completed", "attention", "blocked", "skipped"})
 _DETAIL_SCHEMA = "x_make.stage_progress.repo/1.0"
 _INDEX_SCHEMA = "x_make.stage_progress.index/1.0"
 _MESSAGE_LIMIT = 10
 _ATOMIC_WRITE_RETRY_LIMIT = 5
 _ATOMIC_WRITE_BACKOFF_SECONDS = 0.25
+# Past this size the journal is compacted to one line per repo; without
+# a bound it grows for the writer's whole lifetime.
+_JOURNAL_MAX_BYTES = 256 * 1024
 
 
 @dataclass(slots=True)
@@ -99,12 +107,25 @@ def _now() -> datetime:
     return datetime.now(UTC)
 
 
-def _atomic_write(path: Path, payload: str) -> None:
+def _fsync_dir(path: Path) -> None:
+    # Persist the rename itself; without this, ext4-style delayed
+    # allocation can survive a crash with the directory entry missing.
+    flags = getattr(os, "O_DIRECTORY", None)
+    if flags is None:  # pragma: no cover - Windows has no directory fds
+        return
+    with suppress(OSError):
+        dir_fd = os.open(path, flags)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _atomic_write(path: Path, payload: bytes, *, durable: bool = False) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     # Use unique temp files to avoid rename collisions on Windows.
     with tempfile.NamedTemporaryFile(
-        "w",
-        encoding="utf-8",
+        "wb",
         dir=path.parent,
         prefix=f"{path.name}.",
         suffix=".tmp",
@@ -112,12 +133,12 @@ def _atomic_write(path: Path, payload: str) -> None:
     ) as tmp_file:
         tmp_file.write(payload)
         tmp_file.flush()
-        os.fsync(tmp_file.fileno())
+        if durable:
+            os.fsync(tmp_file.fileno())
         tmp_path = Path(tmp_file.name)
     for attempt in range(_ATOMIC_WRITE_RETRY_LIMIT):
         try:
             tmp_path.replace(path)
-            break
         except PermissionError:
             if attempt == _ATOMIC_WRITE_RETRY_LIMIT - 1:
                 with suppress(OSError):
@@ -130,49 +151,96 @@ def _atomic_write(path: Path, payload: str) -> None:
             with suppress(OSError):
                 tmp_path.unlink()
             raise
+        else:
+            if durable:
+                _fsync_dir(path.parent)
+            break
+
+
+def _journal_line(entry: StageProgressEntry) -> bytes:
+    return (
+        _json_codec.dumps_bytes(
+            {
+                "ts": entry.updated_at.isoformat(),
+                "repo_id": entry.repo_id,
+                "status": entry.status,
+            }
+        )
+        + b"\n"
+    )
 
 
 def _sanitize_messages(messages: Sequence[str] | None) -> list[str]:
     if not messages:
         return []
-    seen: set[str] = set()
-    normalized: list[str] = []
-    for message in messages:
-        text = str(message).strip()
-        if not text or text in seen:
-            continue
-        normalized.append(text)
-        seen.add(text)
-        if len(normalized) >= _MESSAGE_LIMIT:
-            break
-    return normalized
+    # dict.fromkeys dedupes in insertion order at C speed; no parallel set.
+    stripped = (text for text in (str(m).strip() for m in messages) if text)
+    return list(dict.fromkeys(stripped))[:_MESSAGE_LIMIT]
+
+
+# Exact-type fast paths for metadata conversion. type(v) dict hits skip
+# the isinstance chain (and its MRO walks) for the types that dominate
+# real metadata blobs; subclasses still fall through to the slow path.
+_JSON_READY_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
 
 
 def _json_ready(value: object) -> object:
-    if value is None or isinstance(value, (str, int, float, bool)):
+    if type(value) in _JSON_READY_PRIMITIVES:
         return value
+    handler = _JSON_READY_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
     if isinstance(value, Path):
         return str(value)
     if isinstance(value, Mapping):
-        mapping = {}
-        for key, val in value.items():
-            mapping[str(key)] = _json_ready(val)
-        return mapping
+        return {str(key): _json_ready(val) for key, val in value.items()}
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
         return [_json_ready(item) for item in value]
     return str(value)
 
 
+def _json_ready_mapping(value: object) -> dict[str, object]:
+    mapping = cast("Mapping[object, object]", value)
+    return {str(key): _json_ready(val) for key, val in mapping.items()}
+
+
+def _json_ready_sequence(value: object) -> list[object]:
+    sequence = cast("Sequence[object]", value)
+    return [_json_ready(item) for item in sequence]
+
+
+_JSON_READY_DISPATCH: dict[type, Callable[[object], object]] = {
+    dict: _json_ready_mapping,
+    list: _json_ready_sequence,
+    tuple: _json_ready_sequence,
+    Path: str,
+}
+
+
 def _normalize_status(status: str) -> str:
-    candidate = status.strip().lower() if isinstance(status, str) else "attention"
-    return candidate if candidate in _ALLOWED_STATUSES else "attention"
+    # record_* passes canonical statuses, so the common case is a single
+    # frozenset probe with no strip/lower allocation.
+    if status in _ALLOWED_STATUSES:
+        return status
+    if isinstance(status, str):
+        candidate = status.strip().lower()
+        if candidate in _ALLOWED_STATUSES:
+            return candidate
+    return "attention"
 
 
+_SLASH_RE = re.compile(r"/+")
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@lru_cache(maxsize=4096)
 def _safe_repo_filename(repo_id: str) -> str:
+    # Pure and called once per lifecycle transition per repo; memoizing
+    # skips the regex and hash work after the first sighting of an id.
     cleaned = repo_id.strip().replace("\\", "/")
-    cleaned = re.sub(r"/+", "/", cleaned)
+    cleaned = _SLASH_RE.sub("/", cleaned)
     cleaned = cleaned.replace("/", "__")
-    cleaned = re.sub(r"[^A-Za-z0-9_.-]", "_", cleaned)
+    cleaned = _UNSAFE_RE.sub("_", cleaned)
     cleaned = cleaned.strip("._")
     if not cleaned:
         cleaned = "repo"
@@ -180,10 +248,6 @@ def _safe_repo_filename(repo_id: str) -> str:
     return f"{cleaned}_{digest}.json"
 
 
-def _entry_sort_key(entry: StageProgressEntry) -> str:
-    return entry.repo_id.lower()
-
-
 @dataclass(slots=True)
 class StageProgressEntry:
     repo_id: str
@@ -194,46 +258,72 @@ class StageProgressEntry:
     started_at: datetime | None = None
     completed_at: datetime | None = None
     updated_at: datetime = field(default_factory=_now)
+    _payload_cache: dict[str, object] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _last_hash: bytes = field(default=b"", repr=False, compare=False)
 
     def to_detail_payload(self, stage_id: str) -> dict[str, object]:
-        return {
-            "schema_version": _DETAIL_SCHEMA,
-            "stage_id": stage_id,
-            "repo_id": self.repo_id,
-            "display_name": self.display_name,
-            "status": self.status,
-            "messages": list(self.messages),
-            "metadata": self.metadata,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        # Bind the optional timestamps once; each is otherwise looked up
+        # twice per call on this per-write hot path. The payload dict is
+        # reused across calls to avoid churning a fresh allocation per
+        # write; callers serialize it before the entry mutates again.
+        started = self.started_at
+        completed = self.completed_at
+        payload = self._payload_cache
+        payload["schema_version"] = _DETAIL_SCHEMA
+        payload["stage_id"] = stage_id
+        payload["repo_id"] = self.repo_id
+        payload["display_name"] = self.display_name
+        payload["status"] = self.status
+        payload["messages"] = list(self.messages)
+        payload["metadata"] = self.metadata
+        payload["started_at"] = started.isoformat() if started else None
+        payload["completed_at"] = completed.isoformat() if completed else None
+        payload["updated_at"] = self.updated_at.isoformat()
+        return payload
 
     def to_index_payload(self, detail_path: str) -> dict[str, object]:
+        started = self.started_at
+        completed = self.completed_at
         return {
             "repo_id": self.repo_id,
             "display_name": self.display_name,
             "status": self.status,
             "detail_path": detail_path,
             "updated_at": self.updated_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
+            "started_at": started.isoformat() if started else None,
+            "completed_at": completed.isoformat() if completed else None,
             "message_preview": list(self.messages[:3]),
         }
 
 
 class StageProgressWriter(RepoProgressReporter):
-    def __init__(self, *, stage_id: str, root_dir: Path | str) -> None:
+    def __init__(
+        self,
+        *,
+        stage_id: str,
+        root_dir: Path | str,
+        autoflush: bool = True,
+        durable: bool = False,
+    ) -> None:
         self.stage_id = stage_id
         self.root_dir = Path(root_dir)
+        # Progress files are rebuildable, so interactive writers default to
+        # skipping fsync; durable=True buys crash-safety at ~ms per write.
+        self._durable = durable
         self.root_dir.mkdir(parents=True, exist_ok=True)
         self._index_path = self.root_dir / "index.json"
         self._entries: dict[str, StageProgressEntry] = {}
         self._entry_files: dict[str, str] = {}
+        # (lowercased, original) repo-id pairs kept sorted via bisect so
+        # _write_index never re-sorts or re-lowers per write.
+        self._sorted_ids: list[tuple[str, str]] = []
+        self._autoflush = autoflush
+        self._index_fingerprint: bytes | None = None
+        self._index_dirty = False
+        self._journal_path = self.root_dir / "journal.jsonl"
+        self._journal: IO[bytes] | None = None
         self.reset()
 
     @property
@@ -245,6 +335,7 @@ class StageProgressWriter(RepoProgressReporter):
         return self.root_dir
 
     def describe(self) -> dict[str, object]:
+        self.flush()
         counts = self._status_counts()
         return {
             "stage_id": self.stage_id,
@@ -257,17 +348,20 @@ class StageProgressWriter(RepoProgressReporter):
     def reset(self) -> None:
         self._entries.clear()
         self._entry_files.clear()
+        self._sorted_ids.clear()
+        # The tree below is wiped, so any cached fingerprint is stale.
+        self._index_fingerprint = None
+        if self._journal is not None:
+            with suppress(OSError):
+                self._journal.close()
+            self._journal = None
+        # One rmtree beats a stat + unlink per child, and the empty index
+        # write is deferred: record_* or describe() will materialize it
+        # before any reader observes state.
         if self.root_dir.exists():
-            for child in self.root_dir.iterdir():
-                try:
-                    if child.is_file():
-                        child.unlink()
-                    else:
-                        shutil.rmtree(child)
-                except OSError:
-                    continue
+            shutil.rmtree(self.root_dir, ignore_errors=True)
         self.root_dir.mkdir(parents=True, exist_ok=True)
-        self._write_index()
+        self._index_dirty = True
 
     def record_pending(
         self,
@@ -381,6 +475,7 @@ class StageProgressWriter(RepoProgressReporter):
         if entry is None:
             entry = StageProgressEntry(repo_id=normalized, display_name=display_name)
             self._entries[normalized] = entry
+            bisect.insort(self._sorted_ids, (normalized.lower(), normalized))
         elif display_name and entry.display_name != display_name:
             entry.display_name = display_name
         return entry
@@ -388,19 +483,30 @@ class StageProgressWriter(RepoProgressReporter):
     def _update_entry(self, entry: StageProgressEntry, update: _EntryUpdate) -> None:
         normalized_status = _normalize_status(update.status)
         now = _now()
-        if update.mark_started and entry.started_at is None:
-            entry.started_at = now
-        if update.mark_completed or normalized_status in _COMPLETION_STATUSES:
-            entry.completed_at = entry.completed_at or now
+        if normalized_status == "running":
+            # Hottest transition during stage execution: only the start
+            # stamp can change, so skip the completion checks entirely.
+            if entry.started_at is None:
+                entry.started_at = now
+        else:
+            if update.mark_started and entry.started_at is None:
+                entry.started_at = now
+            if (
+                update.mark_completed or normalized_status in _COMPLETION_STATUSES
+            ) and entry.completed_at is None:
+                entry.completed_at = now
         entry.status = normalized_status
         sanitized = _sanitize_messages(update.messages)
         if sanitized:
             if update.replace_messages:
                 entry.messages = tuple(sanitized)
             else:
-                combined = list(entry.messages)
-                combined.extend(sanitized)
-                entry.messages = tuple(_sanitize_messages(combined))
+                # Both sides are already sanitized; only dedupe and cap.
+                entry.messages = tuple(
+                    list(dict.fromkeys((*entry.messages, *sanitized)))[
+                        :_MESSAGE_LIMIT
+                    ]
+                )
         elif update.replace_messages:
             entry.messages = ()
         if update.metadata:
@@ -408,35 +514,104 @@ class StageProgressWriter(RepoProgressReporter):
             for key, value in update.metadata.items():
                 meta[str(key)] = _json_ready(value)
         entry.updated_at = now
+        self._append_journal(entry)
         self._write_entry(entry)
 
+    def _append_journal(self, entry: StageProgressEntry) -> None:
+        # One O(1) appended line per transition gives readers a recovery
+        # trail while the O(N) index rewrite is deferred. With autoflush
+        # the index is already rewritten per transition, so the journal
+        # would be pure extra IO on the hot path.
+        if self._autoflush:
+            return
+        if self._journal is None:
+            self._journal = self._journal_path.open("ab")
+        line = _journal_line(entry)
+        with suppress(OSError):
+            self._journal.write(line)
+            self._journal.flush()
+            if self._journal.tell() > _JOURNAL_MAX_BYTES:
+                self._compact_journal()
+
+    def _compact_journal(self) -> None:
+        # Rewrite as one line per repo (its latest transition); the full
+        # history is recoverable from the entry files, so the journal
+        # only needs enough to reconcile a stale index.
+        if self._journal is not None:
+            with suppress(OSError):
+                self._journal.close()
+            self._journal = None
+        compacted = b"".join(
+            _journal_line(entry) for entry in self._entries.values()
+        )
+        with suppress(OSError):
+            self._journal_path.write_bytes(compacted)
+        self._journal = self._journal_path.open("ab")
+
     def _write_entry(self, entry: StageProgressEntry) -> None:
-        filename = _safe_repo_filename(entry.repo_id)
-        self._entry_files[entry.repo_id] = filename
+        filename = self._entry_files.get(entry.repo_id)
+        if filename is None:
+            filename = _safe_repo_filename(entry.repo_id)
+            self._entry_files[entry.repo_id] = filename
         detail_path = self.root_dir / filename
         payload = entry.to_detail_payload(self.stage_id)
-        serialized = json.dumps(payload, indent=2, sort_keys=False)
-        _atomic_write(detail_path, serialized)
-        self._write_index()
-
-    def _write_index(self) -> None:
+        # Fingerprint everything but the freshness stamp so idempotent
+        # re-records (retry/resume loops) skip the file replace entirely.
+        semantic = {key: val for key, val in payload.items() if key != "updated_at"}
+        digest = hashlib.blake2b(
+            _json_codec.dumps_bytes(semantic), digest_size=16
+        ).digest()
+        if digest == entry._last_hash:
+            return
+        entry._last_hash = digest
+        serialized = _json_codec.dumps_bytes(payload, indent_2=True)
+        _atomic_write(detail_path, serialized, durable=self._durable)
+        if self._autoflush:
+            self._write_index(now=entry.updated_at)
+        else:
+            self._index_dirty = True
+
+    def flush(self) -> None:
+        """Write the index if entry updates were recorded since the last write.
+
+        Only meaningful with ``autoflush=False``, where record_* calls
+        defer the O(N) index rewrite to stage boundaries.
+        """
+
+        if self._index_dirty:
+            self._write_index()
+
+    def _write_index(self, now: datetime | None = None) -> None:
         counts = self._status_counts()
-        ordered_entries = sorted(self._entries.values(), key=_entry_sort_key)
+        ordered_entries = [self._entries[repo_id] for _, repo_id in self._sorted_ids]
         index_entries = []
         for entry in ordered_entries:
             detail_path = self._entry_files.get(entry.repo_id) or ""
             index_entries.append(entry.to_index_payload(detail_path))
+        # Everything except the top-level timestamp derives from the entry
+        # list, so fingerprint just that; identical content means the file
+        # on disk is already current and the rewrite can be skipped.
+        fingerprint = hashlib.blake2b(
+            _json_codec.dumps_bytes(index_entries), digest_size=16
+        ).digest()
+        if fingerprint == self._index_fingerprint:
+            self._index_dirty = False
+            return
         payload = {
             "schema_version": _INDEX_SCHEMA,
             "stage_id": self.stage_id,
-            "updated_at": _now().isoformat(),
+            # Reuse the transition timestamp when the caller has one; a
+            # second _now() here would only differ by microseconds.
+            "updated_at": (now or _now()).isoformat(),
             "entries_dir": str(self.entries_dir),
             "total_entries": len(ordered_entries),
             "status_counts": counts,
             "entries": index_entries,
         }
-        serialized = json.dumps(payload, indent=2, sort_keys=False)
-        _atomic_write(self._index_path, serialized)
+        serialized = _json_codec.dumps_bytes(payload, indent_2=True)
+        _atomic_write(self._index_path, serialized, durable=self._durable)
+        self._index_fingerprint = fingerprint
+        self._index_dirty = False
 
     def _status_counts(self) -> dict[str, int]:
         counts: MutableMapping[str, int] = dict.fromkeys(_ALLOWED_STATUSES, 0)
@@ -0,0 +1,485 @@
+"""Structured telemetry events shared by orchestrator runs."""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final, cast
+
+from . import _json_codec
+from .json_contracts import ValidationErrorType, compile_validator, validate_schema
+from .x_env_x import get_env_bool
+
+__all__ = [
+    "EVENT_SCHEMA",
+    "TelemetryEvent",
+    "add_listener",
+    "coerce_event",
+    "drain_listeners",
+    "dump_to_file",
+    "dumps",
+    "emit_event",
+    "flush_sink",
+    "loads",
+    "make_event",
+    "make_event_fast",
+    "refresh_stdout_flag",
+    "remove_listener",
+    "set_async_listeners",
+    "set_sink",
+    "validate_event",
+    "validate_many",
+]
+
+LEVELS: tuple[str, ...] = ("debug", "info", "warning", "error")
+# Hashed membership for the schema's only enum; validators and fast paths
+# probe this instead of scanning the list.
+_LEVEL_SET: frozenset[str] = frozenset(LEVELS)
+
+EVENT_SCHEMA: dict[str, object] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "level": {"enum": list(LEVELS)},
+        "details": {"type": "object"},
+        "emitted_at": {"type": "string", "minLength": 1},
+    },
+    "required": ["name", "level", "emitted_at"],
+    "additionalProperties": False,
+}
+
+_STDOUT_ENV = "X_TELEMETRY_STDOUT"
+# Read once at import; emit_event branches on the cached bool instead of
+# parsing the environment per event. refresh_stdout_flag re-reads it for
+# processes that toggle the variable after import.
+_STDOUT_ENABLED: bool = get_env_bool(_STDOUT_ENV)
+
+
+def refresh_stdout_flag() -> None:
+    """Re-read the stdout-echo environment flag used by emit_event."""
+
+    global _STDOUT_ENABLED
+    _STDOUT_ENABLED = get_env_bool(_STDOUT_ENV)
+
+# Fail fast at import if the event schema itself is malformed, then bind
+# the validator exactly once. The schema never changes at runtime, so the
+# (compiled, when fastjsonschema is available) validator is resolved here
+# instead of through validate_payload's schema-key cache on every event.
+# The bound callable holds no mutable state and is safe to share across
+# threads; Final guarantees no code path rebinds it.
+validate_schema(EVENT_SCHEMA)
+_VALIDATE_EVENT: Final[Callable[[object], None]] = compile_validator(EVENT_SCHEMA)
+
+TelemetryListener = Callable[[Mapping[str, object]], None]
+
+# Copy-on-write: register/unregister rebuild the tuple under the lock,
+# so emit paths read it without locking (rebinding is atomic under the
+# GIL and readers see either the old or the new tuple).
+_LISTENERS: tuple[TelemetryListener, ...] = ()
+_LISTENER_QUEUE_SIZE = 1024
+_LISTENER_QUEUE: queue.Queue[Mapping[str, object]] | None = None
+_LISTENER_WORKER: threading.Thread | None = None
+_ASYNC_LISTENERS = False
+# One non-reentrant lock guards both the listener registry and the sink
+# state; no code path re-enters it, and emit_event holds it only long
+# enough to buffer or flush a line.
+_STATE_LOCK = threading.Lock()
+_SINK_PATH: Path | None = None
+_SINK_BATCH_SIZE: int = 1
+_SINK_BUFFER: list[bytes] = []
+_SINK_BUFFERED_BYTES: int = 0
+# Cap on buffered bytes: a large-batch configuration still flushes once
+# this much is pending, bounding both memory and data loss on crash.
+_SINK_BUFFER_BYTE_CAP: int = 64 * 1024
+
+
+# Millisecond-bucketed timestamp cache: events emitted in a burst within
+# the same millisecond share one formatted string instead of each paying
+# for a datetime build and isoformat. Plain assignments are GIL-atomic.
+_TS_CACHE_MS: int = -1
+_TS_CACHE_STR: str = ""
+
+
+def _timestamp() -> str:
+    global _TS_CACHE_MS, _TS_CACHE_STR  # noqa: PLW0603 - single-slot cache
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms != _TS_CACHE_MS:
+        _TS_CACHE_MS = now_ms
+        # UTC isoformat always ends "+00:00"; slice instead of str.replace.
+        _TS_CACHE_STR = datetime.now(UTC).isoformat()[:-6] + "Z"
+    return _TS_CACHE_STR
+
+
+@dataclass(slots=True, frozen=True)
+class TelemetryEvent:
+    """Single telemetry event suitable for JSONL sinks."""
+
+    name: str
+    level: str = "info"
+    details: Mapping[str, object] = field(default_factory=dict)
+    emitted_at: str = field(default_factory=_timestamp)
+
+    def as_dict(self) -> dict[str, object]:
+        # The stored details mapping is private to the event (the
+        # constructors copy caller input unless ownership was handed
+        # over), so expose it without another walk; validators and
+        # serializers treat the payload read-only.
+        # Keys are emitted in canonical (sorted) order so serialization
+        # can skip its own per-call key sort.
+        return {
+            "details": self.details,
+            "emitted_at": self.emitted_at,
+            "level": self.level,
+            "name": self.name,
+        }
+
+
+def _keys_sorted(mapping: Mapping[str, object]) -> bool:
+    # One O(n) comparison pass, no allocation; cheap enough to guard the
+    # zero-copy ownership transfer without giving up canonical output.
+    previous = ""
+    for key in mapping:
+        if key < previous:
+            return False
+        previous = key
+    return True
+
+
+def make_event(
+    name: str,
+    *,
+    level: str = "info",
+    details: Mapping[str, object] | None = None,
+    emitted_at: str | None = None,
+    details_owned: bool = False,
+) -> TelemetryEvent:
+    """Build and validate a :class:`TelemetryEvent`.
+
+    With ``details_owned=True`` a dict *details* whose keys are already
+    in sorted order is stored without the defensive copy; the caller
+    hands over ownership and must not mutate it afterwards. Unsorted
+    dicts are re-sorted into a copy so serialization stays canonical.
+    """
+
+    if details is None:
+        detail_map: dict[str, object] = {}
+    elif details_owned and isinstance(details, dict) and _keys_sorted(details):
+        detail_map = details
+    else:
+        # Sorting once at construction keeps the stored details canonical
+        # so every later serialization skips its key sort.
+        detail_map = dict(sorted(details.items()))
+    event = TelemetryEvent(
+        name=name,
+        level=level,
+        details=detail_map,
+        emitted_at=emitted_at or _timestamp(),
+    )
+    validate_event(event.as_dict())
+    return event
+
+
+def make_event_fast(
+    name: str,
+    *,
+    level: str = "info",
+    details: Mapping[str, object] | None = None,
+    emitted_at: str | None = None,
+) -> TelemetryEvent:
+    """Build a :class:`TelemetryEvent` with inline checks, no schema walk.
+
+    Hand-specialized to the fixed ``EVENT_SCHEMA``: a handful of branch
+    tests cover everything the validator would check for well-formed
+    keyword input. Anything off the fast path falls back to
+    :func:`make_event` and its full validation.
+    """
+
+    if (
+        isinstance(name, str)
+        and name
+        and level in _LEVEL_SET
+        and (details is None or isinstance(details, Mapping))
+        and (emitted_at is None or (isinstance(emitted_at, str) and emitted_at))
+    ):
+        return TelemetryEvent(
+            name=name,
+            level=level,
+            details=dict(sorted(details.items())) if details else {},
+            emitted_at=emitted_at or _timestamp(),
+        )
+    return make_event(name, level=level, details=details, emitted_at=emitted_at)
+
+
+def validate_event(payload: Mapping[str, object]) -> dict[str, object]:
+    """Validate *payload* against ``EVENT_SCHEMA`` and return it as a dict."""
+
+    # Validation only reads the mapping, so an input that is already a
+    # dict passes through without the defensive copy.
+    data = payload if isinstance(payload, dict) else dict(payload)
+    level = data.get("level")
+    if isinstance(level, str) and level not in _LEVEL_SET:
+        # O(1) early rejection for the common failure mode; the full
+        # validator never runs for a bad level.
+        msg = f"{level!r} is not one of {list(LEVELS)}"
+        raise ValidationErrorType(msg)
+    _VALIDATE_EVENT(data)
+    return data
+
+
+def coerce_event(payload: Mapping[str, object]) -> TelemetryEvent:
+    """Convert a validated payload mapping into a :class:`TelemetryEvent`."""
+
+    data = validate_event(payload)
+    details_obj = data.get("details")
+    details: dict[str, object] = {}
+    if isinstance(details_obj, Mapping):
+        details_items = cast("Mapping[str, object]", details_obj).items()
+        details = {str(key): value for key, value in sorted(details_items)}
+    return TelemetryEvent(
+        name=cast("str", data["name"]),
+        level=cast("str", data["level"]),
+        details=details,
+        emitted_at=cast("str", data["emitted_at"]),
+    )
+
+
+# Canonical top-level key order, as produced by TelemetryEvent.as_dict.
+_CANONICAL_KEYS: tuple[str, ...] = ("details", "emitted_at", "level", "name")
+
+
+def _serialize(payload: Mapping[str, object]) -> str:
+    # Shared by dumps/emit_event so already-validated payloads are not
+    # walked through the schema a second time before serialization. The
+    # codec dispatches to orjson when importable. Payloads already in
+    # canonical order (everything as_dict produces) skip the encoder's
+    # per-call key sort.
+    return _serialize_bytes(payload).decode("utf-8")
+
+
+def _serialize_bytes(payload: Mapping[str, object]) -> bytes:
+    if tuple(payload) == _CANONICAL_KEYS:
+        return _json_codec.dumps_bytes(payload)
+    return _json_codec.dumps_bytes(payload, sort_keys=True)
+
+
+def dumps(event: TelemetryEvent | Mapping[str, object]) -> str:
+    """Serialize an event to canonical (sorted-key) JSON."""
+
+    payload = event.as_dict() if isinstance(event, TelemetryEvent) else dict(event)
+    return _serialize(validate_event(payload))
+
+
+def loads(text: str | bytes) -> TelemetryEvent:
+    """Parse and validate a serialized telemetry event."""
+
+    payload_obj: object = _json_codec.loads(text)
+    if not isinstance(payload_obj, Mapping):
+        msg = "telemetry event JSON must be an object"
+        raise TypeError(msg)
+    # coerce_event validates; a second validate_event here walked the
+    # same dict through the schema twice per ingested line.
+    return coerce_event(cast("Mapping[str, object]", payload_obj))
+
+
+def validate_many(lines: Iterable[str | bytes]) -> list[TelemetryEvent]:
+    """Parse and validate many serialized events, returning them in order.
+
+    Batch replay path for consumers re-reading JSONL sinks: callables are
+    bound to locals outside the loop so each line costs one parse, one
+    validation, and one append.
+    """
+
+    parse = _json_codec.loads
+    coerce = coerce_event
+    events: list[TelemetryEvent] = []
+    append = events.append
+    for raw in lines:
+        payload_obj: object = parse(raw)
+        if not isinstance(payload_obj, Mapping):
+            msg = "telemetry event JSON must be an object"
+            raise TypeError(msg)
+        append(coerce(cast("Mapping[str, object]", payload_obj)))
+    return events
+
+
+def add_listener(listener: TelemetryListener) -> None:
+    """Register *listener* to receive every emitted event payload.
+
+    Payloads arrive as read-only mapping views shared by all listeners;
+    copy before mutating.
+    """
+
+    global _LISTENERS
+    with _STATE_LOCK:
+        if listener not in _LISTENERS:
+            _LISTENERS = (*_LISTENERS, listener)
+
+
+def remove_listener(listener: TelemetryListener) -> None:
+    """Unregister a previously added listener, ignoring unknown ones."""
+
+    global _LISTENERS
+    with _STATE_LOCK:
+        if listener in _LISTENERS:
+            _LISTENERS = tuple(
+                registered for registered in _LISTENERS if registered != listener
+            )
+
+
+def set_async_listeners(*, enabled: bool) -> None:
+    """Dispatch listener callbacks from a background worker thread.
+
+    When enabled, emit_event only enqueues the payload; a daemon worker
+    fans it out, so the emitter is no longer serialized behind the
+    slowest listener. Call :func:`drain_listeners` before reading
+    listener side effects. Disabling drains first, then restores the
+    default synchronous dispatch.
+    """
+
+    global _ASYNC_LISTENERS
+    if not enabled and _ASYNC_LISTENERS:
+        drain_listeners()
+    _ASYNC_LISTENERS = enabled
+
+
+def drain_listeners() -> None:
+    """Block until every queued payload has been handed to listeners."""
+
+    if _LISTENER_QUEUE is not None:
+        _LISTENER_QUEUE.join()
+
+
+def _listener_worker() -> None:
+    queue_obj = _LISTENER_QUEUE
+    if queue_obj is None:  # pragma: no cover - worker starts after queue
+        return
+    while True:
+        payload = queue_obj.get()
+        try:
+            _dispatch_to_listeners(payload)
+        except Exception:  # noqa: BLE001, S110 - a raising listener must not
+            # kill the worker or skip task_done, which would wedge
+            # drain_listeners (and shutdown) forever.
+            pass
+        finally:
+            queue_obj.task_done()
+
+
+def _dispatch_to_listeners(payload: Mapping[str, object]) -> None:
+    # Lock-free read of the copy-on-write tuple; see _LISTENERS above.
+    for listener in _LISTENERS:
+        listener(payload)
+
+
+def _enqueue_for_listeners(payload: Mapping[str, object]) -> None:
+    global _LISTENER_QUEUE, _LISTENER_WORKER
+    with _STATE_LOCK:
+        if _LISTENER_QUEUE is None:
+            _LISTENER_QUEUE = queue.Queue(maxsize=_LISTENER_QUEUE_SIZE)
+        if _LISTENER_WORKER is None or not _LISTENER_WORKER.is_alive():
+            _LISTENER_WORKER = threading.Thread(
+                target=_listener_worker,
+                name="telemetry-listeners",
+                daemon=True,
+            )
+            _LISTENER_WORKER.start()
+    _LISTENER_QUEUE.put(payload)
+
+
+def set_sink(path: Path | str | None, *, batch_size: int = 1) -> None:
+    """Set (or clear) the JSONL file that emitted events append to.
+
+    With ``batch_size`` above one, emitted lines are buffered and written
+    with a single append once the buffer fills; call :func:`flush_sink`
+    (or switch sinks) to drain early. The default writes per event.
+    """
+
+    global _SINK_PATH, _SINK_BATCH_SIZE
+    with _STATE_LOCK:
+        _flush_sink_locked()
+        _SINK_PATH = Path(path) if path is not None else None
+        _SINK_BATCH_SIZE = max(1, batch_size)
+
+
+def _flush_sink_locked() -> None:
+    global _SINK_BUFFERED_BYTES
+    if not _SINK_BUFFER:
+        return
+    if _SINK_PATH is not None:
+        _SINK_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with _SINK_PATH.open("ab") as handle:
+            handle.writelines(line + b"\n" for line in _SINK_BUFFER)
+    _SINK_BUFFER.clear()
+    _SINK_BUFFERED_BYTES = 0
+
+
+def flush_sink() -> None:
+    """Append any buffered sink lines now; a no-op when nothing is queued."""
+
+    with _STATE_LOCK:
+        _flush_sink_locked()
+
+
+# Batched lines must not be lost when the process exits normally.
+atexit.register(flush_sink)
+
+
+def emit_event(event: TelemetryEvent | Mapping[str, object]) -> None:
+    """Validate *event*, append it to the sink, and notify listeners."""
+
+    # TelemetryEvent instances built via make_event/coerce_event were
+    # validated at construction, so only raw mappings are re-checked.
+    if isinstance(event, TelemetryEvent):
+        validated = event.as_dict()
+    else:
+        validated = validate_event(event)
+    # The sink is binary, so the serialized bytes go to disk untouched;
+    # the str decode happens only for the optional stdout echo.
+    line = _serialize_bytes(validated)
+    global _SINK_BUFFERED_BYTES
+    with _STATE_LOCK:
+        if _SINK_PATH is not None:
+            _SINK_BUFFER.append(line)
+            _SINK_BUFFERED_BYTES += len(line)
+            if (
+                len(_SINK_BUFFER) >= _SINK_BATCH_SIZE
+                or _SINK_BUFFERED_BYTES >= _SINK_BUFFER_BYTE_CAP
+            ):
+                _flush_sink_locked()
+    if _STDOUT_ENABLED:
+        print(line.decode("utf-8"))
+    # A read-only view replaces the old per-listener dict copies; the
+    # proxy enforces at runtime that listeners do not mutate the payload.
+    view = MappingProxyType(validated)
+    if _ASYNC_LISTENERS:
+        _enqueue_for_listeners(view)
+    else:
+        _dispatch_to_listeners(view)
+
+
+def dump_to_file(
+    path: Path | str,
+    events: Iterable[TelemetryEvent | Mapping[str, object]],
+) -> Path:
+    """Append *events* to *path* as JSONL, returning the path."""
+
+    path_obj = Path(path)
+    path_obj.parent.mkdir(parents=True, exist_ok=True)
+    # One binary append handle for the whole batch; the previous
+    # open/write/close per event was an avoidable syscall storm.
+    with path_obj.open("ab") as handle:
+        for event in events:
+            if isinstance(event, TelemetryEvent):
+                validated = event.as_dict()
+            else:
+                validated = validate_event(event)
+            handle.write(_serialize_bytes(validated) + b"\n")
+    return path_obj
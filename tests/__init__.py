@@ -14,8 +14,12 @@ if "httpx" not in sys.modules:
         def close(self) -> None:
             return None
 
+    # One shared stub instance; every Client(...) call during collection
+    # reuses it instead of allocating a fresh dummy.
+    _shared_dummy = _DummyClient()
+
     def _httpx_client(**_: object) -> _DummyClient:
-        return _DummyClient()
+        return _shared_dummy
 
     fake_httpx.HTTPError = RuntimeError  # type: ignore[attr-defined]
     fake_httpx.Client = _httpx_client  # type: ignore[attr-defined]
@@ -6,15 +6,16 @@ from typing import TYPE_CHECKING, cast
 
 # ruff: noqa: S101 - pytest prefers assert statements for readability
 
+import pytest
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import pytest
-
 import x_make_common_x.exporters as exporters_module
 from x_make_common_x.exporters import (
     export_graphviz_to_svg,
     export_html_to_pdf,
+    export_many_html_to_pdf,
     export_markdown_to_pdf,
     export_mermaid_to_svg,
 )
@@ -145,6 +146,51 @@ def test_export_html_to_pdf_success_with_stub(tmp_path: Path) -> None:
     assert result.output_path == tmp_path / "report.pdf"
 
 
+def test_export_many_html_to_pdf_success_with_stub(tmp_path: Path) -> None:
+    def runner(command: Sequence[str]) -> CompletedProcess[str]:
+        _write_from_command(command)
+        return _completed(command, stdout="ok")
+
+    results = export_many_html_to_pdf(
+        [("one", "<h1>One</h1>"), ("two", "<h1>Two</h1>")],
+        output_dir=tmp_path,
+        wkhtmltopdf_path=tmp_path / "wkhtmltopdf.exe",
+        runner=runner,
+    )
+
+    assert [result.succeeded for result in results] == [True, True]
+    assert results[0].output_path == tmp_path / "one.pdf"
+    assert results[1].output_path == tmp_path / "two.pdf"
+    assert (tmp_path / "one.html").exists()
+    assert (tmp_path / "two.html").exists()
+
+
+def test_export_batch_runs_jobs_in_order(tmp_path: Path) -> None:
+    jobs: list[exporters_module.ExportJob] = [
+        (
+            "graphviz->svg",
+            {"dot_source": "digraph { A -> B }", "output_dir": tmp_path, "stem": "a"},
+        ),
+        (
+            "graphviz->svg",
+            {"dot_source": "digraph { B -> C }", "output_dir": tmp_path, "stem": "b"},
+        ),
+    ]
+
+    results = exporters_module.export_batch(jobs)
+
+    assert [result.exporter for result in results] == ["graphviz->svg"] * 2
+    assert (tmp_path / "a.dot").exists()
+    assert (tmp_path / "b.dot").exists()
+
+
+def test_export_batch_rejects_unknown_kind(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="unknown export job kind"):
+        exporters_module.export_batch(
+            [("nope", {"output_dir": tmp_path})], max_workers=1
+        )
+
+
 def test_export_mermaid_to_svg_missing_binary(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
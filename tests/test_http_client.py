@@ -0,0 +1,57 @@
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from x_make_common_x.x_http_client_x import HttpClient, HttpError
+
+
+class _FakeStreamResponse:
+    def __init__(self, status_code: int, chunks: list[bytes]) -> None:
+        self.status_code = status_code
+        self._chunks = chunks
+
+    def iter_bytes(self, chunk_size: int | None = None) -> list[bytes]:
+        del chunk_size
+        return self._chunks
+
+    def __enter__(self) -> _FakeStreamResponse:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+class _FakeStreamClient:
+    def __init__(self, response: _FakeStreamResponse) -> None:
+        self._response = response
+
+    def stream(self, *_args: object, **_kwargs: object) -> _FakeStreamResponse:
+        return self._response
+
+    def close(self) -> None:
+        return None
+
+
+def test_stream_get_writes_chunks_to_sink() -> None:
+    client = HttpClient()
+    client._client = _FakeStreamClient(  # noqa: SLF001 - inject test transport
+        _FakeStreamResponse(200, [b"abc", b"defg"])
+    )
+    sink = io.BytesIO()
+    written = client.stream_get("http://example.test/blob", sink=sink)
+    assert written == 7
+    assert sink.getvalue() == b"abcdefg"
+
+
+def test_stream_get_error_status_raises_once() -> None:
+    client = HttpClient()
+    client._client = _FakeStreamClient(  # noqa: SLF001 - inject test transport
+        _FakeStreamResponse(500, [b"boom"])
+    )
+    with pytest.raises(HttpError) as excinfo:
+        client.stream_get("http://example.test/blob", sink=io.BytesIO())
+    assert str(excinfo.value) == "HTTP 500 calling http://example.test/blob"
@@ -7,7 +7,10 @@ from typing import TYPE_CHECKING, ParamSpec, Protocol, TypeVar, cast
 
 import pytest
 
-from x_make_common_x.x_subprocess_utils_x import run_command
+from x_make_common_x.x_subprocess_utils_x import (
+    _reset_test_mode_cache,
+    run_command,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -15,6 +18,15 @@ else:
     Callable = typing.Callable
 
 
+@pytest.fixture(autouse=True)
+def _fresh_test_mode() -> typing.Iterator[None]:
+    # run_command caches the test-mode probe; monkeypatched environments
+    # need a fresh read on both sides of each test.
+    _reset_test_mode_cache()
+    yield
+    _reset_test_mode_cache()
+
+
 class _CapturedIO(Protocol):
     out: str
     err: str
@@ -56,9 +68,10 @@ def fake_run(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
     def _fake_run(
         argv: list[str],
         **_kwargs: object,
-    ) -> CompletedProcess[str]:
+    ) -> CompletedProcess[bytes]:
         calls.append(list(argv))
-        return CompletedProcess(argv, 0, "", "")
+        # run_command captures byte pipes and decodes once itself.
+        return CompletedProcess(argv, 0, b"", b"")
 
     monkeypatch.setattr(subprocess, "run", _fake_run)
     return calls
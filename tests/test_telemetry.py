@@ -0,0 +1,59 @@
+# ruff: noqa: S101
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from x_make_common_x import telemetry
+
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from pathlib import Path
+
+
+def test_make_event_round_trip() -> None:
+    event = telemetry.make_event("scan.finished", details={"files": 12})
+    serialized = telemetry.dumps(event)
+    restored = telemetry.loads(serialized)
+    assert restored == event
+
+
+def test_make_event_rejects_bad_level() -> None:
+    with pytest.raises(ValidationError):
+        telemetry.make_event("scan.finished", level="loud")
+
+
+def test_emit_event_appends_to_sink(tmp_path: Path) -> None:
+    sink = tmp_path / "events.jsonl"
+    telemetry.set_sink(sink)
+    try:
+        telemetry.emit_event(telemetry.make_event("one"))
+        telemetry.emit_event(telemetry.make_event("two", level="error"))
+    finally:
+        telemetry.set_sink(None)
+    lines = sink.read_text(encoding="utf-8").splitlines()
+    assert [telemetry.loads(line).name for line in lines] == ["one", "two"]
+
+
+def test_listeners_receive_payload_copies() -> None:
+    received: list[dict[str, object]] = []
+
+    def listener(payload: dict[str, object]) -> None:
+        received.append(payload)
+
+    telemetry.add_listener(listener)
+    try:
+        telemetry.emit_event(telemetry.make_event("ping"))
+    finally:
+        telemetry.remove_listener(listener)
+    assert len(received) == 1
+    assert received[0]["name"] == "ping"
+
+
+def test_as_dict_uses_canonical_key_order() -> None:
+    event = telemetry.make_event("scan.started", details={"b": 2, "a": 1})
+    payload = event.as_dict()
+    assert tuple(payload) == ("details", "emitted_at", "level", "name")
+    assert tuple(event.details) == ("a", "b")
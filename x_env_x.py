@@ -7,14 +7,21 @@ import sys
 from pathlib import Path
 
 _WORKSPACE_ROOT = Path(__file__).resolve().parent.parent
+_WORKSPACE_INSTALLED = False
 
 
 def ensure_workspace_on_syspath() -> None:
     """Ensure the workspace root is present on ``sys.path``."""
 
+    global _WORKSPACE_INSTALLED  # noqa: PLW0603 - idempotence flag
+    if _WORKSPACE_INSTALLED:
+        # Many entry points call this; after the first success the
+        # linear sys.path scan is pure overhead.
+        return
     root_str = str(_WORKSPACE_ROOT)
     if root_str not in sys.path:
         sys.path.insert(0, root_str)
+    _WORKSPACE_INSTALLED = True
 
 
 def get_env_str(name: str, *, default: str | None = None) -> str | None:
@@ -27,16 +34,27 @@ def get_env_str(name: str, *, default: str | None = None) -> str | None:
     return stripped or default
 
 
+# Hoisted flag vocabularies; building these set literals per call showed
+# up on hot paths that consult env flags repeatedly.
+_TRUE_FLAGS = frozenset({"1", "true", "yes", "on"})
+_FALSE_FLAGS = frozenset({"0", "false", "no", "off"})
+
+
 def get_env_bool(name: str, *, default: bool = False) -> bool:
     """Interpret an environment variable as a truthy flag."""
 
     value = os.environ.get(name)
     if value is None:
         return default
+    # The overwhelmingly common values skip the strip/lower allocations.
+    if value == "1":
+        return True
+    if value == "0":
+        return False
     lowered = value.strip().lower()
-    if lowered in {"1", "true", "yes", "on"}:
+    if lowered in _TRUE_FLAGS:
         return True
-    if lowered in {"0", "false", "no", "off"}:
+    if lowered in _FALSE_FLAGS:
         return False
     return default
 
@@ -6,13 +6,17 @@ import importlib
 import importlib.machinery
 import importlib.util
 import sys
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol, cast
+from typing import TYPE_CHECKING, NamedTuple, Protocol, cast
+
+from . import _json_codec
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
     from types import ModuleType
+    from typing import IO
 
 
 def _load_httpx_module() -> ModuleType:
@@ -76,13 +80,26 @@ def _import_external_httpx(stub_path: Path) -> ModuleType | None:
 httpx = _load_httpx_module()
 
 
+class _HttpxHeaders(Protocol):
+    def get(self, key: str, default: str = ...) -> str: ...
+
+
 class _HttpxResponse(Protocol):
     status_code: int
     text: str
+    content: bytes
+    encoding: str | None
+    headers: _HttpxHeaders
 
     def json(self) -> object: ...
 
 
+class _HttpxStreamResponse(Protocol):
+    status_code: int
+
+    def iter_bytes(self, chunk_size: int | None = ...) -> Iterable[bytes]: ...
+
+
 class _HttpxClient(Protocol):
     def request(
         self,
@@ -94,6 +111,15 @@ class _HttpxClient(Protocol):
         params: Mapping[str, str] | None = None,
     ) -> _HttpxResponse: ...
 
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> AbstractContextManager[_HttpxStreamResponse]: ...
+
     def close(self) -> None: ...
 
 
@@ -110,17 +136,36 @@ class _HttpxClientFactory(Protocol):
 _HTTPErrorType = cast("type[Exception]", getattr(httpx, "HTTPError", RuntimeError))
 
 
-@dataclass(slots=True)
-class HttpResponse:
+class HttpResponse(NamedTuple):
+    """Response snapshot; a NamedTuple allocates cheaper than a dataclass."""
+
     status_code: int
-    text: str
+    content: bytes
     json: object | None
+    encoding: str | None = None
+
+    @property
+    def text(self) -> str:
+        """Body decoded on demand; JSON-only consumers never pay for it.
+
+        Uses the charset httpx derived from the response headers,
+        falling back to UTF-8 when none was declared.
+        """
+
+        return self.content.decode(self.encoding or "utf-8", "replace")
 
 
 class HttpError(RuntimeError):
     """Raised when an HTTP request fails."""
 
 
+_HTTP_VERBS = ("GET", "HEAD", "POST", "PUT", "DELETE", "PATCH", "OPTIONS")
+# Known spellings resolve without the per-call str.upper allocation.
+_METHOD_CACHE: dict[str, str] = {
+    spelling: verb for verb in _HTTP_VERBS for spelling in (verb, verb.lower())
+}
+
+
 class HttpClient:
     """Thin wrapper around ``httpx.Client`` with conservative defaults."""
 
@@ -148,6 +193,17 @@ class HttpClient:
             client_kwargs["base_url"] = base_url
         if transport is not None:
             client_kwargs["transport"] = transport
+        limits_factory = cast(
+            "Callable[..., object] | None",
+            getattr(httpx, "Limits", None),
+        )
+        if limits_factory is not None:
+            # Explicit keep-alive budget so repeated calls to the same
+            # host reuse pooled connections instead of re-handshaking.
+            client_kwargs["limits"] = limits_factory(
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            )
         client_instance = client_factory(
             timeout=timeout,
             follow_redirects=follow_redirects,
@@ -158,6 +214,12 @@ class HttpClient:
         if headers:
             self._default_headers.update(_to_header_mapping(headers))
 
+    def __enter__(self) -> HttpClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def close(self) -> None:
         self._client.close()
 
@@ -171,14 +233,20 @@ class HttpClient:
         params: Mapping[str, object] | Iterable[tuple[str, object]] | None = None,
         allowed_status_codes: Iterable[int] | None = None,
     ) -> HttpResponse:
-        combined_headers = dict(self._default_headers)
         if headers:
-            combined_headers.update(_to_header_mapping(headers))
+            combined_headers: Mapping[str, str] = {
+                **self._default_headers,
+                **_to_header_mapping(headers),
+            }
+        else:
+            # No per-call headers: the defaults are only read, so the
+            # per-request copy is skipped.
+            combined_headers = self._default_headers
         query_params = _to_param_mapping(params) if params else None
         allowed = {int(code) for code in allowed_status_codes or ()}
         try:
             response = self._client.request(
-                method.upper(),
+                _METHOD_CACHE.get(method) or method.upper(),
                 url,
                 headers=combined_headers,
                 json=json,
@@ -189,20 +257,75 @@ class HttpClient:
             raise HttpError(message) from exc
         status_code = response.status_code
         if status_code >= self._ERROR_THRESHOLD and status_code not in allowed:
-            error_body = response.text.strip()
+            # Cap the decode at 4 KiB: the body only feeds the exception
+            # message, so decoding megabytes of error HTML is wasted.
+            error_body = response.content[:4096].decode("utf-8", "replace").strip()
             message = f"HTTP {status_code} calling {url}: {error_body}"
             raise HttpError(message)
-        json_payload: object | None
-        try:
-            json_payload = response.json()
-        except ValueError:
-            json_payload = None
+        # Only bodies that announce JSON are parsed; HEAD responses and
+        # HTML/text bodies skip the decode-and-fail round trip entirely.
+        # Parsing the raw bytes through the codec beats httpx's .json().
+        json_payload: object | None = None
+        if "json" in response.headers.get("content-type", ""):
+            try:
+                json_payload = _json_codec.loads(response.content)
+            except ValueError:
+                json_payload = None
         return HttpResponse(
             status_code=status_code,
-            text=response.text,
+            content=response.content,
             json=json_payload,
+            encoding=getattr(response, "encoding", None),
         )
 
+    def stream_get(  # noqa: PLR0913 -- keyword-only params keep call sites explicit
+        self,
+        url: str,
+        *,
+        sink: IO[bytes],
+        headers: Mapping[str, str] | Iterable[tuple[str, str]] | None = None,
+        params: Mapping[str, object] | Iterable[tuple[str, object]] | None = None,
+        chunk_size: int = 65536,
+    ) -> int:
+        """Stream a GET body into *sink*, returning the bytes written.
+
+        Peak memory stays at ``chunk_size`` instead of the whole body,
+        and disk writes overlap the following network reads.
+        """
+
+        if headers:
+            combined_headers: Mapping[str, str] = {
+                **self._default_headers,
+                **_to_header_mapping(headers),
+            }
+        else:
+            combined_headers = self._default_headers
+        query_params = _to_param_mapping(params) if params else None
+        written = 0
+        try:
+            with self._client.stream(
+                "GET",
+                url,
+                headers=combined_headers,
+                params=query_params,
+            ) as response:
+                status_code = response.status_code
+                if status_code >= self._ERROR_THRESHOLD:
+                    message = f"HTTP {status_code} calling {url}"
+                    raise HttpError(message)
+                for chunk in response.iter_bytes(chunk_size):
+                    sink.write(chunk)
+                    written += len(chunk)
+        except HttpError:
+            # The status raise above must not be re-wrapped; when httpx
+            # is absent _HTTPErrorType degrades to RuntimeError, which
+            # HttpError subclasses.
+            raise
+        except _HTTPErrorType as exc:
+            message = f"HTTP error calling {url}: {exc}"
+            raise HttpError(message) from exc
+        return written
+
     def head(
         self,
         url: str,
@@ -236,9 +359,41 @@ class HttpClient:
         )
 
 
+_SHARED_LOCK = threading.Lock()
+_SHARED_CLIENT: HttpClient | None = None
+
+
+def shared_client() -> HttpClient:
+    """Return the lazily-created process-wide :class:`HttpClient`.
+
+    Short-lived callers reuse one connection pool instead of paying
+    TCP/TLS setup per wrapper instance. The shared instance must not be
+    closed; scope-managed lifetimes should construct their own client.
+    """
+
+    global _SHARED_CLIENT
+    with _SHARED_LOCK:
+        if _SHARED_CLIENT is None:
+            _SHARED_CLIENT = HttpClient()
+        return _SHARED_CLIENT
+
+
+def _is_str_dict(mapping: dict[object, object]) -> bool:
+    return all(
+        type(key) is str and type(value) is str for key, value in mapping.items()
+    )
+
+
 def _to_header_mapping(
     headers: Mapping[str, str] | Iterable[tuple[str, str]],
 ) -> Mapping[str, str]:
+    # Callers almost always pass dict[str, str] already; the coercing
+    # comprehension (a new dict plus two str() calls per item) is only
+    # worth paying when the probe fails.
+    if isinstance(headers, dict) and _is_str_dict(
+        cast("dict[object, object]", headers)
+    ):
+        return cast("dict[str, str]", headers)
     if isinstance(headers, Mapping):
         typed_mapping = cast("Mapping[str, str]", headers)
         return {str(key): str(value) for key, value in typed_mapping.items()}
@@ -249,6 +404,8 @@ def _to_header_mapping(
 def _to_param_mapping(
     params: Mapping[str, object] | Iterable[tuple[str, object]],
 ) -> Mapping[str, str]:
+    if isinstance(params, dict) and _is_str_dict(cast("dict[object, object]", params)):
+        return cast("dict[str, str]", params)
     if isinstance(params, Mapping):
         typed_mapping = cast("Mapping[str, object]", params)
         return {str(key): str(value) for key, value in typed_mapping.items()}
@@ -256,4 +413,4 @@ def _to_param_mapping(
     return {str(key): str(value) for key, value in pairs}
 
 
-__all__ = ["HttpClient", "HttpError", "HttpResponse"]
+__all__ = ["HttpClient", "HttpError", "HttpResponse", "shared_client"]
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import os
+import shlex
+import shutil
 import subprocess
+from functools import lru_cache
 from typing import Iterable, Mapping, Sequence  # noqa: UP035
 
 from .x_logging_utils_x import log_debug, log_info
@@ -31,8 +34,13 @@ class CommandError(RuntimeError):
 
 _TRUTHY = {"1", "true", "yes", "on"}
 
+# Computed once and reused: run_command can fire hundreds of times per
+# build, and the three environ probes per call add up. Tests that
+# monkeypatch the environment call _reset_test_mode_cache().
+_TEST_MODE_CACHE: bool | None = None
 
-def _is_test_mode() -> bool:
+
+def _compute_test_mode() -> bool:
     env = os.environ
     explicit = env.get("X_MAKE_TEST_MODE")
     if explicit is not None:
@@ -42,15 +50,51 @@ def _is_test_mode() -> bool:
     return bool(env.get("PYTEST_RUN_CONFIG"))
 
 
-def _format_command(argv: Sequence[str]) -> str:
-    if not argv:
-        return "<empty command>"
+def _is_test_mode() -> bool:
+    global _TEST_MODE_CACHE  # noqa: PLW0603 - single-slot cache
+    if _TEST_MODE_CACHE is None:
+        _TEST_MODE_CACHE = _compute_test_mode()
+    return _TEST_MODE_CACHE
+
+
+def _reset_test_mode_cache() -> None:
+    global _TEST_MODE_CACHE  # noqa: PLW0603 - single-slot cache
+    _TEST_MODE_CACHE = None
+
+
+@lru_cache(maxsize=256)
+def _resolve_executable(name: str) -> str | None:
+    """Resolve a bare command name to an absolute path, memoized.
+
+    Handing subprocess an absolute executable skips the PATH search in
+    the spawned child and keeps CPython on its posix_spawn fast path.
+    Names containing a separator are left for subprocess to handle.
+    """
+
+    if os.path.sep in name or (os.path.altsep and os.path.altsep in name):
+        return None
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=256)
+def _format_command_cached(argv: tuple[str, ...]) -> str:
     try:
-        return subprocess.list2cmdline(list(argv))
+        if os.name == "posix":
+            # POSIX quoting is both correct for this platform and
+            # cheaper than list2cmdline's per-character Windows rules.
+            return shlex.join(argv)
+        return subprocess.list2cmdline(argv)
     except Exception:  # noqa: BLE001 - defensive fallback
         return " ".join(str(part) for part in argv)
 
 
+def _format_command(argv: Sequence[str]) -> str:
+    if not argv:
+        return "<empty command>"
+    # Builds recur the same commands; memoize on the argv shape.
+    return _format_command_cached(tuple(argv))
+
+
 def run_command(
     args: Iterable[str],
     *,
@@ -58,17 +102,30 @@ def run_command(
     env: Mapping[str, str] | None = None,
 ) -> subprocess.CompletedProcess[str]:
     argv = list(args)
-    log_debug("Running command:", " ".join(argv))
+    # _emit joins lazily behind its level check; pre-joining here would
+    # build the string even with debug logging off.
+    log_debug("Running command:", *argv)
     if _is_test_mode():
         rendered = _format_command(argv)
         log_info("[test-mode] automation command:", rendered)
         print(f"[test-mode] $ {rendered}")
-    completed = subprocess.run(  # noqa: S603 - argv built from trusted call sites
+    raw = subprocess.run(  # noqa: S603 - argv built from trusted call sites
         argv,
         capture_output=True,
-        text=True,
         check=False,
         env=dict(env) if env is not None else None,
+        # With a caller-supplied env the child's PATH may differ from
+        # ours, so only pre-resolve against the inherited environment.
+        executable=_resolve_executable(argv[0]) if argv and env is None else None,
+    )
+    # Raw byte pipes with one decode at the end: text mode re-decodes
+    # every chunk through a TextIOWrapper, which is memory churn for
+    # tools that emit megabytes of log output.
+    completed = subprocess.CompletedProcess(
+        argv,
+        raw.returncode,
+        raw.stdout.decode("utf-8", "replace"),
+        raw.stderr.decode("utf-8", "replace"),
     )
     if check and completed.returncode != 0:
         raise CommandError(